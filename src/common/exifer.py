@@ -1,4 +1,5 @@
 import json
+import os
 import shutil
 import subprocess
 import atexit
@@ -284,7 +285,7 @@ class Exifer:
         cmd_args = ["-json"]
         if args:
             cmd_args.extend(args)
-        cmd_args.append(str(file_path))
+        cmd_args.append(os.fspath(file_path))
         
         output = self._run(cmd_args)
         try:
@@ -370,7 +371,7 @@ class Exifer:
             else:
                 args.append(f"-{tag}={value}")
         
-        args.append(str(file_path))
+        args.append(os.fspath(file_path))
         
         # Use one-off mode with timeout for large files to avoid hangs
         if timeout is not None:
@@ -6,12 +6,28 @@ naming scheme, used by both File Organizer and Preview Maker.
 
 import calendar
 import re
+import string
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, Pattern
 
 from common.constants import DEFAULT_SOURCE_FILENAME_TEMPLATE, DEFAULT_ARCHIVE_PATH_TEMPLATE, DEFAULT_ARCHIVE_FILENAME_TEMPLATE
 from common.logger import Logger
 
+# Precompiled output template: ``(literal, field, format_spec, pad_table)``
+# segments.  ``field`` is *None* for a trailing literal with no placeholder
+# after it; ``pad_table`` is set for the zero-padding specs below.
+# Each segment carries its leading literal together with its field: a flat
+# opcode list (separate literal / str / pad / fmt instructions) doubles the
+# loop iterations for the default templates and measured slower.
+_TemplatePlan = list[tuple[str, Optional[str], str, Optional[list[str]]]]
+
+# Zero-padded renderings of small ints for the specs used by the default
+# templates (month/day/time fields and year/sequence).
+_PAD2 = [f"{i:02d}" for i in range(100)]
+_PAD4 = [f"{i:04d}" for i in range(10000)]
+_PAD_TABLES = {"02d": _PAD2, "04d": _PAD4}
+
 
 class Formatter:
     """Parses, validates and formats structured photo filenames.
@@ -119,10 +135,19 @@ class Formatter:
             )
         )
 
-        # Compile source template into a regex pattern.
+        # Compile source template into a regex pattern (shared per template).
         self._source_pattern, self._source_fields = self._compile_source_template(
             self._source_filename_template
         )
+        self._source_field_set = frozenset(self._source_fields)
+
+        # Parse output templates once; rendering then skips str.format parsing.
+        self._archive_path_plan = self._compile_output_template(
+            self._archive_path_template
+        )
+        self._archive_filename_plan = self._compile_output_template(
+            self._archive_filename_template
+        )
 
         self._logger.debug(
             f"Source pattern: {self._source_pattern.pattern}"
@@ -149,16 +174,39 @@ class Formatter:
             Dict of field names to values on success, *None* if the name
             does not match the expected pattern.
         """
-        match = self._source_pattern.match(filepath.name)
+        fields = self._parse_name(self._source_filename_template, filepath.name)
+        if fields is None:
+            return None
+        # Callers enrich and mutate the result, so hand out a fresh dict.
+        return dict(fields)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _parse_name(
+        cls, template: str, name: str
+    ) -> tuple[tuple[str, int | str], ...] | None:
+        """Parse *name* against *template* into immutable ``(field, value)`` pairs.
+
+        Batch and watch modes parse the same filename more than once (the
+        filter step, sibling checks, output path building), so results are
+        cached per *(template, name)* and shared by every Formatter using
+        that template.
+
+        Returns:
+            Field/value pairs in :attr:`_FIELD_DEFAULTS` order, or *None* if
+            the name does not match the template.
+        """
+        pattern, source_fields = cls._compile_source_template(template)
+        match = pattern.match(name)
         if not match:
             return None
 
         try:
-            values: dict[str, int | str] = dict(self._FIELD_DEFAULTS)
+            values: dict[str, int | str] = dict(cls._FIELD_DEFAULTS)
 
-            for i, field in enumerate(self._source_fields, 1):
+            for i, field in enumerate(source_fields, 1):
                 raw = match.group(i)
-                if field in self._NUMERIC_FIELDS:
+                if field in cls._NUMERIC_FIELDS:
                     values[field] = int(raw)
                 else:
                     values[field] = raw
@@ -171,7 +219,7 @@ class Formatter:
             values["suffix"] = str(values["suffix"])
             values["extension"] = str(values["extension"]).lower()
 
-            return values
+            return tuple(values.items())
         except (ValueError, IndexError, KeyError):
             return None
 
@@ -188,7 +236,7 @@ class Formatter:
         Returns:
             List of validation error messages (empty if valid).
         """
-        fields = frozenset(self._source_fields)
+        fields = self._source_field_set
         errors: list[str] = []
 
         if "modifier" in fields and parsed["modifier"] not in self._VALID_MODIFIERS:
@@ -230,7 +278,9 @@ class Formatter:
             Formatted path string (e.g., ``"2024/2024.01.15"``).
         """
         try:
-            return self._archive_path_template.format_map(parsed)
+            if self._archive_path_plan is None:
+                return self._archive_path_template.format_map(parsed)
+            return self._render(self._archive_path_plan, parsed)
         except KeyError as e:
             self._logger.error(f"Missing field in archive_path_template: {e}")
             raise ValueError(f"Invalid archive_path_template: missing field {e}")
@@ -249,7 +299,9 @@ class Formatter:
             (e.g., ``"2024.01.15.10.30.45.E.FAM.POR.0001.A.RAW"``).
         """
         try:
-            return self._archive_filename_template.format_map(parsed)
+            if self._archive_filename_plan is None:
+                return self._archive_filename_template.format_map(parsed)
+            return self._render(self._archive_filename_plan, parsed)
         except KeyError as e:
             self._logger.error(f"Missing field in archive_filename_template: {e}")
             raise ValueError(f"Invalid archive_filename_template: missing field {e}")
@@ -269,7 +321,70 @@ class Formatter:
         """
         return template.format_map(parsed)
 
-    def _compile_source_template(self, template: str) -> tuple[Pattern[str], list[str]]:
+    @staticmethod
+    def _compile_output_template(template: str) -> _TemplatePlan | None:
+        """Precompile an output template into literal / field segments.
+
+        Only plain ``{name}`` and ``{name:spec}`` placeholders are
+        precompiled.  Templates using conversions (``!r``), attribute or
+        index access, nested specs or malformed braces return *None* so
+        the caller falls back to :meth:`str.format_map` with its usual
+        semantics and errors.
+
+        ``02d`` / ``04d`` specs get a lookup table so in-range ints skip
+        :func:`format`; other values still go through it.
+
+        Args:
+            template: ``str.format()``-style output template.
+
+        Returns:
+            List of ``(literal, field, format_spec, pad_table)`` tuples,
+            or *None*.
+        """
+        plan: _TemplatePlan = []
+        try:
+            for literal, field, spec, conversion in string.Formatter().parse(template):
+                if field is None:
+                    plan.append((literal, None, "", None))
+                    continue
+                if conversion or not field.isidentifier() or "{" in (spec or ""):
+                    return None
+                plan.append((literal, field, spec or "", _PAD_TABLES.get(spec)))
+        except ValueError:
+            return None
+        return plan
+
+    @staticmethod
+    def _render(plan: _TemplatePlan, parsed: dict[str, int | str]) -> str:
+        """Render a precompiled output template.
+
+        Args:
+            plan: Segments from :meth:`_compile_output_template`.
+            parsed: Parsed filename dict.
+
+        Returns:
+            The formatted string.
+
+        Raises:
+            KeyError: If a field is missing from *parsed*.
+        """
+        parts: list[str] = []
+        for literal, field, spec, pad in plan:
+            parts.append(literal)
+            if field is None:
+                continue
+            value = parsed[field]
+            if pad is not None and type(value) is int and 0 <= value < len(pad):
+                parts.append(pad[value])
+            elif spec:
+                parts.append(format(value, spec))
+            else:
+                parts.append(str(value))
+        return "".join(parts)
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _compile_source_template(cls, template: str) -> tuple[Pattern[str], tuple[str, ...]]:
         """Compile a source filename template into a regex pattern.
 
         Splits the template into alternating *literal* / ``{field}``
@@ -286,6 +401,9 @@ class Formatter:
             template: Source filename template, e.g.
                 ``"{year}.{month}.{day}.{extension}"``.
 
+        Results are cached per template, so every Formatter built from the
+        same configuration shares one compiled pattern.
+
         Returns:
             Tuple of *(compiled regex, ordered field names)*.
 
@@ -306,14 +424,14 @@ class Formatter:
             else:
                 # Field name.
                 field_name = part
-                if field_name not in self._ALL_FIELDS:
+                if field_name not in cls._ALL_FIELDS:
                     raise ValueError(
                         f"Unknown field '{field_name}' in source_filename_template. "
-                        f"Allowed fields: {', '.join(sorted(self._ALL_FIELDS))}"
+                        f"Allowed fields: {', '.join(sorted(cls._ALL_FIELDS))}"
                     )
                 field_names.append(field_name)
 
-                if field_name in self._NUMERIC_FIELDS:
+                if field_name in cls._NUMERIC_FIELDS:
                     regex_parts.append(r"(\d+)")
                 elif field_name == "extension":
                     regex_parts.append(r"([a-zA-Z0-9]+)")
@@ -331,7 +449,7 @@ class Formatter:
 
         regex_parts.append("$")
         pattern = re.compile("".join(regex_parts), re.IGNORECASE)
-        return pattern, field_names
+        return pattern, tuple(field_names)
 
     def _validate_date(
         self, parsed: dict[str, int | str], fields: frozenset[str],
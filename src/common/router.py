@@ -6,8 +6,9 @@ Used by both file-organizer and preview-maker.
 """
 
 import fnmatch
+import re
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from common.formatter import Formatter
 from common.logger import Logger
@@ -56,6 +57,21 @@ class Router:
         self._formatter = Formatter(logger=logger, formats=formats)
         section = routes if routes is not None else DEFAULT_ROUTES
         self._routes: list[list[Any]] = section.get("rules", [])
+        # Lower-cased patterns compiled once: (match, subfolder, protect).
+        self._matchers: list[tuple[Callable[[str], Any], str, bool]] = [
+            (
+                re.compile(fnmatch.translate(rule[0].lower())).match,
+                rule[1],
+                rule[2] if len(rule) > 2 else False,
+            )
+            for rule in self._routes
+        ]
+        # Literal pattern → subfolder (first rule wins) and the catch-all
+        # subfolder, for get_folders_for_patterns().
+        self._folder_by_pattern: dict[str, str] = {}
+        for rule in self._routes:
+            self._folder_by_pattern.setdefault(rule[0], rule[1])
+        self._fallback_folder: str | None = self._routes[-1][1] if self._routes else None
 
     def get_target_folder(
         self, parsed: dict[str, int | str], base_path: Path, filename: str | None = None,
@@ -78,15 +94,14 @@ class Router:
             Tuple of (target_folder_path, protect_flag).
         """
         formatted_path = self._formatter.format_path(parsed)
-        date_root_dir = base_path / formatted_path
 
         if filename is None:
             filename = self._formatter.format_filename(parsed) + f".{parsed['extension']}"
 
         subfolder, protect = self._match_route(filename)
         if subfolder == ".":
-            return date_root_dir, protect
-        return date_root_dir / subfolder, protect
+            return base_path / formatted_path, protect
+        return base_path / formatted_path / subfolder, protect
 
     def get_normalized_filename(self, parsed: dict[str, int | str]) -> str:
         """Format filename according to the configured archive template.
@@ -121,18 +136,9 @@ class Router:
         """
         folders: set[str] = set()
         for pattern in patterns:
-            # Direct lookup: find the route whose pattern matches ours.
-            for rule in self._routes:
-                if rule[0] == pattern:
-                    if rule[1] != ".":
-                        folders.add(rule[1])
-                    break
-            else:
-                # Fallback: last route (catch-all).
-                if self._routes:
-                    last_subfolder = self._routes[-1][1]
-                    if last_subfolder != ".":
-                        folders.add(last_subfolder)
+            folder = self._folder_by_pattern.get(pattern, self._fallback_folder)
+            if folder is not None and folder != ".":
+                folders.add(folder)
         return folders
 
     def _match_route(self, filename: str) -> tuple[str, bool]:
@@ -146,10 +152,9 @@ class Router:
                 (e.g. ``["*", "DERIVATIVES"]``) in the routing configuration.
         """
         filename_lower = filename.lower()
-        for rule in self._routes:
-            if fnmatch.fnmatch(filename_lower, rule[0].lower()):
-                protect = rule[2] if len(rule) > 2 else False
-                return rule[1], protect
+        for match, subfolder, protect in self._matchers:
+            if match(filename_lower):
+                return subfolder, protect
         raise ValueError(
             f"No routing rule matched '{filename}'. "
             f"Add a catch-all rule like [\"*\", \"DERIVATIVES\"] to your routes."
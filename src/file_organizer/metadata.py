@@ -10,6 +10,7 @@ Actual reading/writing of metadata is done by individual components
 (FileProcessor, Maker) using :class:`~common.tagger.Tagger`.
 """
 
+import copy
 from typing import Any, Optional
 
 from file_organizer.constants import DEFAULT_METADATA  # noqa: F401  (re-exported)
@@ -51,6 +52,10 @@ class ArchiveMetadata:
         }
         self._languages: dict[str, Any] = section.get("languages", {})
 
+        # The config is fixed after construction, so the value projection is
+        # computed on first use and reused for every subsequent file.
+        self._values_cache: Optional[dict[str, Any]] = None
+
     def _normalize_text(self, value: Any) -> Optional[str]:
         """
         Normalize a config text field to a single string.
@@ -79,7 +84,7 @@ class ArchiveMetadata:
         """
         Return dictionary of tag -> value with language variants from metadata.json.
 
-        Processes the metadata.json configuration and returns a flat dictionary with all tags and their values, including language-specific variants.
+        Processes the metadata.json configuration and returns a flat dictionary with all tags and their values, including language-specific variants. The projection is computed once per instance; each call returns a deep copy, so list values such as Creator are not shared with the cache.
 
         Args:
             logger (Optional[Logger]): Logger for debug messages.
@@ -93,12 +98,23 @@ class ArchiveMetadata:
                     ...
                 }
         """
-        tags: dict[str, Any] = {}
-
         if not self._languages:
             if logger:
                 logger.debug("No languages in metadata config; skipping")
-            return tags
+            return {}
+
+        if self._values_cache is None:
+            self._values_cache = self._build_metadata_values()
+        return copy.deepcopy(self._values_cache)
+
+    def _build_metadata_values(self) -> dict[str, Any]:
+        """
+        Build the tag -> value projection returned by :meth:`get_metadata_values`.
+
+        Returns:
+            dict[str, Any]: Flat dictionary of tags and language variants.
+        """
+        tags: dict[str, Any] = {}
 
         # Choose default language block (first with default=True, else first)
         default_block: Optional[dict[str, Any]] = None
@@ -110,11 +126,17 @@ class ArchiveMetadata:
         if default_block is None:
             _, default_block = next(iter(self._languages.items()))
 
+        tag_items = list(self._tags.items())
+
         for lang_code, block in self._languages.items():
             if not isinstance(block, dict):
                 continue
 
-            for field_name, tag_base in self._tags.items():
+            # Per-language constants, hoisted out of the field loop.
+            lang_suffix = "-" + lang_code
+            is_default = block is default_block
+
+            for field_name, tag_base in tag_items:
                 raw_value = block.get(field_name)
 
                 # Special handling for Creator: must be a list
@@ -136,11 +158,10 @@ class ArchiveMetadata:
                     continue
 
                 # Language-specific variant (TAG-langCode)
-                lang_tag = f"{tag_base}-{lang_code}"
-                tags[lang_tag] = normalized
+                tags[tag_base + lang_suffix] = normalized
 
                 # Default/plain variant for the chosen default language
-                if block is default_block:
+                if is_default:
                     tags[tag_base] = normalized
 
         return tags
@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Any
 import datetime
 import uuid
 
 from common.exifer import Exifer
 from common.tagger import Tagger
-from common.tags import KeyValueTag, HistoryTag
+from common.tags import Tag, KeyValueTag, HistoryTag
 from common.logger import Logger
 from common.version import get_version
 from common.constants import EXIFTOOL_LARGE_FILE_TIMEOUT, MIME_TYPE_MAP, TAG_XMP_XMPMM_DOCUMENT_ID, TAG_XMP_XMPMM_INSTANCE_ID, XMP_ACTION_CREATED, XMP_ACTION_EDITED, TAG_XMP_DC_FORMAT, TAG_XMP_EXIF_DATETIME_DIGITIZED, TAG_EXIFIFD_DATETIME_DIGITIZED, TAG_EXIFIFD_CREATE_DATE, TAG_EXIF_OFFSET_TIME_DIGITIZED, TAG_IFD0_DATETIME, TAG_IFD0_MAKE, TAG_IFD0_MODEL, TAG_IFD0_SOFTWARE, TAG_XMP_TIFF_MAKE, TAG_XMP_TIFF_MODEL, TAG_XMP_TIFF_SOFTWARE, TAG_XMP_XMP_CREATOR_TOOL
@@ -186,6 +187,37 @@ class MetadataWorkflow(Workflow):
             tagger.read(KeyValueTag(tag))
         existing_tags = tagger.end() or {}
 
+        tags = self._build_xmp_history(file_path, file_datetime, existing_tags)
+
+        # ── batch-write all tags + history in one call ────────────
+        self._logger.debug(f"Writing metadata to {file_path.name}...")
+        tagger.begin()
+        for tag in tags:
+            tagger.write(tag)
+        tagger.end()  # single exiftool call for all writes
+
+        self._logger.info(f"XMP history written for {file_path.name}")
+
+    def _build_xmp_history(
+        self,
+        file_path: Path,
+        file_datetime: datetime.datetime,
+        existing_tags: dict[str, Any],
+    ) -> list[Tag]:
+        """
+        Build the tags written by :meth:`_write_xmp_history` without touching disk.
+
+        Args:
+            file_path: Path to the target file (used for dc:Format).
+            file_datetime: Datetime for the history entries (with timezone).
+            existing_tags: Tags already present in the file, keyed by
+                exiftool tag name (see :meth:`_write_xmp_history`).
+
+        Returns:
+            Tag descriptors in write order.
+        """
+        tags: list[Tag] = []
+
         # Get or generate DocumentID (without dashes)
         document_id = existing_tags.get(TAG_XMP_XMPMM_DOCUMENT_ID)
         if not document_id:
@@ -206,18 +238,14 @@ class MetadataWorkflow(Workflow):
         edited_instance_id = uuid.uuid4().hex
         self._logger.debug(f"Generated InstanceID for 'edited': {edited_instance_id}")
 
-        # ── batch-write all tags + history in one call ────────────
-        self._logger.debug(f"Writing metadata to {file_path.name}...")
-        tagger.begin()
-
-        tagger.write(KeyValueTag(TAG_XMP_XMPMM_DOCUMENT_ID, document_id))
-        tagger.write(KeyValueTag(TAG_XMP_XMPMM_INSTANCE_ID, edited_instance_id))
+        tags.append(KeyValueTag(TAG_XMP_XMPMM_DOCUMENT_ID, document_id))
+        tags.append(KeyValueTag(TAG_XMP_XMPMM_INSTANCE_ID, edited_instance_id))
 
         # dc:Format from extension map
         file_extension = file_path.suffix.lower().lstrip('.')
         dc_format = MIME_TYPE_MAP.get(file_extension)
         if dc_format:
-            tagger.write(KeyValueTag(TAG_XMP_DC_FORMAT, dc_format))
+            tags.append(KeyValueTag(TAG_XMP_DC_FORMAT, dc_format))
 
         # Handle DateTimeDigitized: write new or enrich existing with timezone
         date_digitized = (
@@ -227,11 +255,11 @@ class MetadataWorkflow(Workflow):
 
         if not date_digitized:
             dt_str = file_datetime.isoformat(timespec='milliseconds')
-            tagger.write(KeyValueTag(TAG_XMP_EXIF_DATETIME_DIGITIZED, dt_str))
+            tags.append(KeyValueTag(TAG_XMP_EXIF_DATETIME_DIGITIZED, dt_str))
             self._logger.debug(f"Writing DateTimeDigitized: {dt_str}")
         elif "+" not in date_digitized and "-" not in date_digitized[10:]:
             dt_str = file_datetime.isoformat(timespec='milliseconds')
-            tagger.write(KeyValueTag(TAG_XMP_EXIF_DATETIME_DIGITIZED, dt_str))
+            tags.append(KeyValueTag(TAG_XMP_EXIF_DATETIME_DIGITIZED, dt_str))
             self._logger.debug(
                 f"Enriching DateTimeDigitized with timezone: {date_digitized} -> {dt_str}"
             )
@@ -245,7 +273,7 @@ class MetadataWorkflow(Workflow):
             offset = file_datetime.strftime("%z")
             if offset:
                 offset_formatted = f"{offset[:3]}:{offset[3:]}"
-                tagger.write(KeyValueTag(TAG_EXIF_OFFSET_TIME_DIGITIZED, offset_formatted))
+                tags.append(KeyValueTag(TAG_EXIF_OFFSET_TIME_DIGITIZED, offset_formatted))
                 self._logger.debug(f"Writing OffsetTimeDigitized: {offset_formatted}")
         elif offset_time_digitized:
             self._logger.debug(f"OffsetTimeDigitized already set: {offset_time_digitized}")
@@ -255,31 +283,31 @@ class MetadataWorkflow(Workflow):
         ifd0_model = existing_tags.get(TAG_IFD0_MODEL)
 
         if ifd0_make:
-            tagger.write(KeyValueTag(TAG_XMP_TIFF_MAKE, ifd0_make))
+            tags.append(KeyValueTag(TAG_XMP_TIFF_MAKE, ifd0_make))
             self._logger.debug(f"Copying Make to XMP: {ifd0_make}")
 
         if ifd0_model:
-            tagger.write(KeyValueTag(TAG_XMP_TIFF_MODEL, ifd0_model))
+            tags.append(KeyValueTag(TAG_XMP_TIFF_MODEL, ifd0_model))
             self._logger.debug(f"Copying Model to XMP: {ifd0_model}")
 
         # Copy IFD0:Software → XMP-xmp:CreatorTool + XMP-tiff:Software
         ifd0_software = existing_tags.get(TAG_IFD0_SOFTWARE)
         if ifd0_software:
-            tagger.write(KeyValueTag(TAG_XMP_XMP_CREATOR_TOOL, ifd0_software))
-            tagger.write(KeyValueTag(TAG_XMP_TIFF_SOFTWARE, ifd0_software))
+            tags.append(KeyValueTag(TAG_XMP_XMP_CREATOR_TOOL, ifd0_software))
+            tags.append(KeyValueTag(TAG_XMP_TIFF_SOFTWARE, ifd0_software))
             self._logger.debug(f"Copying Software to XMP: {ifd0_software}")
 
         # XMP History entries
         agent = f"scan-batcher {get_version()}"
 
-        tagger.write(HistoryTag(
+        tags.append(HistoryTag(
             action=XMP_ACTION_CREATED,
             when=file_datetime,
             software_agent=agent,
             instance_id=created_instance_id,
         ))
 
-        tagger.write(HistoryTag(
+        tags.append(HistoryTag(
             action=XMP_ACTION_EDITED,
             when=file_datetime,
             software_agent=agent,
@@ -287,6 +315,4 @@ class MetadataWorkflow(Workflow):
             instance_id=edited_instance_id,
         ))
 
-        tagger.end()  # single exiftool call for all writes
-
-        self._logger.info(f"XMP history written for {file_path.name}")
+        return tags
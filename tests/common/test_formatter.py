@@ -3,22 +3,47 @@ Tests for common.formatter module: parsing, validation and formatting.
 """
 
 from pathlib import Path
+from typing import Any, Callable
 
 import pytest
 
 from common.formatter import Formatter
 
 
+@pytest.fixture(scope="class")
+def formatter_factory() -> Callable[..., Formatter]:
+    """Return a factory that reuses one Formatter per template combination."""
+    cache: dict[tuple[Any, ...], Formatter] = {}
+
+    def _get(**templates: str | None) -> Formatter:
+        key = tuple(sorted(templates.items()))
+        if key not in cache:
+            cache[key] = Formatter(**templates)
+        return cache[key]
+
+    return _get
+
+
+@pytest.fixture
+def default_parsed() -> dict[str, int | str]:
+    """Return a fresh dict of default parsed filename fields."""
+    return {
+        "year": 2024, "month": 1, "day": 15,
+        "hour": 10, "minute": 30, "second": 45,
+        "modifier": "E", "group": "FAM", "subgroup": "POR",
+        "sequence": 1, "side": "A", "suffix": "RAW",
+        "extension": "tif",
+    }
+
+
 class TestParsing:
     """
     Test cases for Formatter.parse().
     """
 
-    def setup_method(self) -> None:
-        self.formatter: Formatter = Formatter()
-
-    def test_parse_exact_date_with_time(self):
-        result = self.formatter.parse(Path('1950.06.15.12.30.45.E.FAM.POR.000001.A.MSR.tiff'))
+    def test_parse_exact_date_with_time(self, formatter_factory):
+        formatter = formatter_factory()
+        result = formatter.parse(Path('1950.06.15.12.30.45.E.FAM.POR.000001.A.MSR.tiff'))
 
         assert result is not None
         assert result["year"] == 1950
@@ -35,8 +60,9 @@ class TestParsing:
         assert result["suffix"] == 'MSR'
         assert result["extension"] == 'tiff'
 
-    def test_parse_circa_month(self):
-        result = self.formatter.parse(Path('1950.06.00.00.00.00.C.FAM.POR.000002.R.WEB.jpg'))
+    def test_parse_circa_month(self, formatter_factory):
+        formatter = formatter_factory()
+        result = formatter.parse(Path('1950.06.00.00.00.00.C.FAM.POR.000002.R.WEB.jpg'))
 
         assert result is not None
         assert result["year"] == 1950
@@ -49,8 +75,9 @@ class TestParsing:
         assert result["side"] == 'R'
         assert result["suffix"] == 'WEB'
 
-    def test_parse_circa_year(self):
-        result = self.formatter.parse(Path('1950.00.00.00.00.00.C.TRV.LND.000003.A.RAW.tiff'))
+    def test_parse_circa_year(self, formatter_factory):
+        formatter = formatter_factory()
+        result = formatter.parse(Path('1950.00.00.00.00.00.C.TRV.LND.000003.A.RAW.tiff'))
 
         assert result is not None
         assert result["year"] == 1950
@@ -60,8 +87,9 @@ class TestParsing:
         assert result["side"] == 'A'
         assert result["suffix"] == 'RAW'
 
-    def test_parse_absent_date(self):
-        result = self.formatter.parse(Path('0000.00.00.00.00.00.A.UNK.000.000001.A.MSR.jpg'))
+    def test_parse_absent_date(self, formatter_factory):
+        formatter = formatter_factory()
+        result = formatter.parse(Path('0000.00.00.00.00.00.A.UNK.000.000001.A.MSR.jpg'))
 
         assert result is not None
         assert result["year"] == 0
@@ -71,129 +99,159 @@ class TestParsing:
         assert result["side"] == 'A'
         assert result["suffix"] == 'MSR'
 
-    def test_parse_with_suffix_raw(self):
-        result = self.formatter.parse(Path('1950.06.15.12.00.00.E.FAM.POR.000001.A.RAW.jpg'))
+    def test_parse_with_suffix_raw(self, formatter_factory):
+        formatter = formatter_factory()
+        result = formatter.parse(Path('1950.06.15.12.00.00.E.FAM.POR.000001.A.RAW.jpg'))
 
         assert result is not None
         assert result["side"] == 'A'
         assert result["suffix"] == 'RAW'
         assert result["extension"] == 'jpg'
 
-    def test_parse_with_suffix_msr(self):
-        result = self.formatter.parse(Path('1950.06.15.12.00.00.E.FAM.POR.000001.R.MSR.tiff'))
+    def test_parse_with_suffix_msr(self, formatter_factory):
+        formatter = formatter_factory()
+        result = formatter.parse(Path('1950.06.15.12.00.00.E.FAM.POR.000001.R.MSR.tiff'))
 
         assert result is not None
         assert result["side"] == 'R'
         assert result["suffix"] == 'MSR'
         assert result["extension"] == 'tiff'
 
-    def test_parse_invalid_format(self):
-        result = self.formatter.parse(Path('invalid.jpg'))
+    def test_parse_invalid_format(self, formatter_factory):
+        formatter = formatter_factory()
+        result = formatter.parse(Path('invalid.jpg'))
         assert result is None
 
-    def test_parse_missing_side(self):
-        result = self.formatter.parse(Path('1950.06.15.12.00.00.E.FAM.POR.000001.MSR.tiff'))
+    def test_parse_missing_side(self, formatter_factory):
+        formatter = formatter_factory()
+        result = formatter.parse(Path('1950.06.15.12.00.00.E.FAM.POR.000001.MSR.tiff'))
         assert result is None
 
-    def test_parse_missing_suffix(self):
-        result = self.formatter.parse(Path('1950.06.15.12.00.00.E.FAM.POR.000001.A.tiff'))
+    def test_parse_missing_suffix(self, formatter_factory):
+        formatter = formatter_factory()
+        result = formatter.parse(Path('1950.06.15.12.00.00.E.FAM.POR.000001.A.tiff'))
         assert result is None
 
-    def test_parse_incomplete_date(self):
-        result = self.formatter.parse(Path('1950.06.15.tiff'))
+    def test_parse_incomplete_date(self, formatter_factory):
+        formatter = formatter_factory()
+        result = formatter.parse(Path('1950.06.15.tiff'))
         assert result is None
 
-    def test_parse_modifier_case_insensitive(self):
-        result = self.formatter.parse(Path('1950.06.15.12.00.00.e.FAM.POR.000001.a.msr.tiff'))
+    def test_parse_modifier_case_insensitive(self, formatter_factory):
+        formatter = formatter_factory()
+        result = formatter.parse(Path('1950.06.15.12.00.00.e.FAM.POR.000001.a.msr.tiff'))
         assert result is not None
         assert result["modifier"] == 'E'
         assert result["side"] == 'A'
         assert result["suffix"] == 'msr'
 
+    def test_repeated_parse_returns_independent_dicts(self, formatter_factory):
+        formatter = formatter_factory()
+        path = Path('1950.06.15.12.00.00.E.FAM.POR.000001.A.MSR.tiff')
+        first = formatter.parse(path)
+        assert first is not None
+        first["exif_year"] = 1951
+        first["year"] = 2000
+
+        second = formatter.parse(path)
+        assert second is not None
+        assert second is not first
+        assert second["year"] == 1950
+        assert "exif_year" not in second
+
 
 class TestValidation:
     """
     Test cases for Formatter.validate().
     """
 
-    def setup_method(self) -> None:
-        self.formatter: Formatter = Formatter()
-
-    def test_valid_exact_date_with_time(self):
-        parsed = self.formatter.parse(Path('1950.06.15.12.30.45.E.FAM.POR.000001.A.MSR.tiff'))
+    def test_valid_exact_date_with_time(self, formatter_factory):
+        formatter = formatter_factory()
+        parsed = formatter.parse(Path('1950.06.15.12.30.45.E.FAM.POR.000001.A.MSR.tiff'))
         assert parsed is not None
-        errors = self.formatter.validate(parsed)
+        errors = formatter.validate(parsed)
         assert len(errors) == 0
 
-    def test_valid_circa_month(self):
-        parsed = self.formatter.parse(Path('1950.06.00.00.00.00.C.FAM.POR.000002.R.WEB.jpg'))
+    def test_valid_circa_month(self, formatter_factory):
+        formatter = formatter_factory()
+        parsed = formatter.parse(Path('1950.06.00.00.00.00.C.FAM.POR.000002.R.WEB.jpg'))
         assert parsed is not None
-        errors = self.formatter.validate(parsed)
+        errors = formatter.validate(parsed)
         assert len(errors) == 0
 
-    def test_valid_circa_year(self):
-        parsed = self.formatter.parse(Path('1950.00.00.00.00.00.C.TRV.LND.000003.A.RAW.tiff'))
+    def test_valid_circa_year(self, formatter_factory):
+        formatter = formatter_factory()
+        parsed = formatter.parse(Path('1950.00.00.00.00.00.C.TRV.LND.000003.A.RAW.tiff'))
         assert parsed is not None
-        errors = self.formatter.validate(parsed)
+        errors = formatter.validate(parsed)
         assert len(errors) == 0
 
-    def test_invalid_month_over_12(self):
-        parsed = self.formatter.parse(Path('1950.13.15.00.00.00.E.FAM.POR.000001.A.MSR.tiff'))
+    def test_invalid_month_over_12(self, formatter_factory):
+        formatter = formatter_factory()
+        parsed = formatter.parse(Path('1950.13.15.00.00.00.E.FAM.POR.000001.A.MSR.tiff'))
         assert parsed is not None
-        errors = self.formatter.validate(parsed)
+        errors = formatter.validate(parsed)
         assert len(errors) > 0
         assert any('month' in error.lower() for error in errors)
 
-    def test_invalid_february_30(self):
-        parsed = self.formatter.parse(Path('1950.02.30.00.00.00.E.FAM.POR.000002.A.MSR.tiff'))
+    def test_invalid_february_30(self, formatter_factory):
+        formatter = formatter_factory()
+        parsed = formatter.parse(Path('1950.02.30.00.00.00.E.FAM.POR.000002.A.MSR.tiff'))
         assert parsed is not None
-        errors = self.formatter.validate(parsed)
+        errors = formatter.validate(parsed)
         assert len(errors) > 0
         assert any('day' in error.lower() for error in errors)
 
-    def test_invalid_day_over_31(self):
-        parsed = self.formatter.parse(Path('1950.06.32.00.00.00.E.FAM.POR.000003.A.MSR.tiff'))
+    def test_invalid_day_over_31(self, formatter_factory):
+        formatter = formatter_factory()
+        parsed = formatter.parse(Path('1950.06.32.00.00.00.E.FAM.POR.000003.A.MSR.tiff'))
         assert parsed is not None
-        errors = self.formatter.validate(parsed)
+        errors = formatter.validate(parsed)
         assert len(errors) > 0
         assert any('day' in error.lower() for error in errors)
 
-    def test_invalid_month_zero_day_nonzero(self):
-        parsed = self.formatter.parse(Path('1950.00.15.00.00.00.C.FAM.POR.000004.A.MSR.tiff'))
+    def test_invalid_month_zero_day_nonzero(self, formatter_factory):
+        formatter = formatter_factory()
+        parsed = formatter.parse(Path('1950.00.15.00.00.00.C.FAM.POR.000004.A.MSR.tiff'))
         assert parsed is not None
-        errors = self.formatter.validate(parsed)
+        errors = formatter.validate(parsed)
         assert len(errors) > 0
         assert any('month is 00 but day' in error.lower() for error in errors)
 
-    def test_invalid_day_zero_time_nonzero(self):
-        parsed = self.formatter.parse(Path('1950.06.00.12.00.00.C.FAM.POR.000005.A.MSR.tiff'))
+    def test_invalid_day_zero_time_nonzero(self, formatter_factory):
+        formatter = formatter_factory()
+        parsed = formatter.parse(Path('1950.06.00.12.00.00.C.FAM.POR.000005.A.MSR.tiff'))
         assert parsed is not None
-        errors = self.formatter.validate(parsed)
+        errors = formatter.validate(parsed)
         assert len(errors) > 0
         assert any('day is 00 but time' in error.lower() for error in errors)
 
-    def test_invalid_hour_over_23(self):
-        parsed = self.formatter.parse(Path('1950.06.15.25.00.00.E.FAM.POR.000006.A.MSR.tiff'))
+    def test_invalid_hour_over_23(self, formatter_factory):
+        formatter = formatter_factory()
+        parsed = formatter.parse(Path('1950.06.15.25.00.00.E.FAM.POR.000006.A.MSR.tiff'))
         assert parsed is not None
-        errors = self.formatter.validate(parsed)
+        errors = formatter.validate(parsed)
         assert len(errors) > 0
         assert any('hour' in error.lower() for error in errors)
 
-    def test_invalid_minute_over_59(self):
-        parsed = self.formatter.parse(Path('1950.06.15.12.61.00.E.FAM.POR.000007.A.MSR.tiff'))
+    def test_invalid_minute_over_59(self, formatter_factory):
+        formatter = formatter_factory()
+        parsed = formatter.parse(Path('1950.06.15.12.61.00.E.FAM.POR.000007.A.MSR.tiff'))
         assert parsed is not None
-        errors = self.formatter.validate(parsed)
+        errors = formatter.validate(parsed)
         assert len(errors) > 0
         assert any('minute' in error.lower() for error in errors)
 
-    def test_invalid_second_over_59(self):
-        parsed = self.formatter.parse(Path('1950.06.15.12.30.61.E.FAM.POR.000008.A.MSR.tiff'))
+    def test_invalid_second_over_59(self, formatter_factory):
+        formatter = formatter_factory()
+        parsed = formatter.parse(Path('1950.06.15.12.30.61.E.FAM.POR.000008.A.MSR.tiff'))
         assert parsed is not None
-        errors = self.formatter.validate(parsed)
+        errors = formatter.validate(parsed)
         assert len(errors) > 0
         assert any('second' in error.lower() for error in errors)
 
-    def test_invalid_modifier(self):
+    def test_invalid_modifier(self, formatter_factory):
+        formatter = formatter_factory()
         parsed: dict[str, int | str] = {
             "year": 1950, "month": 6, "day": 15,
             "hour": 12, "minute": 30, "second": 0,
@@ -201,11 +259,12 @@ class TestValidation:
             "group": "FAM", "subgroup": "POR", "sequence": 1,
             "side": "A", "suffix": "MSR", "extension": "tiff",
         }
-        errors = self.formatter.validate(parsed)
+        errors = formatter.validate(parsed)
         assert len(errors) > 0
         assert any('modifier' in error.lower() for error in errors)
 
-    def test_invalid_side(self):
+    def test_invalid_side(self, formatter_factory):
+        formatter = formatter_factory()
         parsed: dict[str, int | str] = {
             "year": 1950, "month": 6, "day": 15,
             "hour": 12, "minute": 30, "second": 0,
@@ -214,38 +273,34 @@ class TestValidation:
             "side": "X",
             "suffix": "MSR", "extension": "tiff",
         }
-        errors = self.formatter.validate(parsed)
+        errors = formatter.validate(parsed)
         assert len(errors) > 0
         assert any('side' in error.lower() for error in errors)
 
-    def test_invalid_sequence_too_large(self):
-        parsed = self.formatter.parse(Path('1950.06.15.12.30.45.E.FAM.POR.010000.A.MSR.tiff'))
+    def test_invalid_sequence_too_large(self, formatter_factory):
+        formatter = formatter_factory()
+        parsed = formatter.parse(Path('1950.06.15.12.30.45.E.FAM.POR.010000.A.MSR.tiff'))
         assert parsed is not None
-        errors = self.formatter.validate(parsed)
+        errors = formatter.validate(parsed)
         assert len(errors) > 0
         assert any('sequence' in error.lower() for error in errors)
 
-    def test_valid_leap_year_feb_29(self):
-        filename = Path('2024.02.29.12.00.00.E.TST.GRP.0001.A.RAW.jpg')
-        parsed = self.formatter.parse(filename)
-        assert parsed is not None
-        errors = self.formatter.validate(parsed)
-        assert len(errors) == 0, f"Should accept Feb 29 in leap year 2024. Errors: {errors}"
-
-    def test_invalid_non_leap_year_feb_29(self):
-        filename = Path('2023.02.29.12.00.00.E.TST.GRP.0001.A.RAW.jpg')
-        parsed = self.formatter.parse(filename)
+    @pytest.mark.parametrize("filename, expected_error", [
+        ("2024.02.29.12.00.00.E.TST.GRP.0001.A.RAW.jpg", None),
+        ("2000.02.29.12.00.00.E.TST.GRP.0001.A.RAW.jpg", None),
+        ("2023.02.29.12.00.00.E.TST.GRP.0001.A.RAW.jpg", "Invalid day value: 29"),
+        ("1900.02.29.12.00.00.E.TST.GRP.0001.A.RAW.jpg", "Invalid day value: 29"),
+        ("2023.02.28.12.00.00.E.TST.GRP.0001.A.RAW.jpg", None),
+    ])
+    def test_leap_year_feb_days(self, formatter_factory, filename, expected_error):
+        formatter = formatter_factory()
+        parsed = formatter.parse(Path(filename))
         assert parsed is not None
-        errors = self.formatter.validate(parsed)
-        assert len(errors) > 0, "Should reject Feb 29 in non-leap year 2023"
-        assert any("Invalid day value: 29" in e for e in errors), f"Unexpected error message: {errors}"
-
-    def test_valid_feb_28_non_leap(self):
-        filename = Path('2023.02.28.12.00.00.E.TST.GRP.0001.A.RAW.jpg')
-        parsed = self.formatter.parse(filename)
-        assert parsed is not None
-        errors = self.formatter.validate(parsed)
-        assert len(errors) == 0
+        errors = formatter.validate(parsed)
+        if expected_error is None:
+            assert errors == [], f"Should accept {filename}. Errors: {errors}"
+        else:
+            assert any(expected_error in e for e in errors), f"Unexpected errors for {filename}: {errors}"
 
 
 class TestFormatting:
@@ -253,98 +308,66 @@ class TestFormatting:
     Tests for Formatter.format_path() and Formatter.format_filename().
     """
 
-    def _create_parsed(
-        self,
-        year: int = 2024,
-        month: int = 1,
-        day: int = 15,
-        hour: int = 10,
-        minute: int = 30,
-        second: int = 45,
-        modifier: str = "E",
-        group: str = "FAM",
-        subgroup: str = "POR",
-        sequence: int = 1,
-        side: str = "A",
-        suffix: str = "RAW",
-        extension: str = "tif"
-    ) -> dict[str, int | str]:
-        return {
-            "year": year, "month": month, "day": day,
-            "hour": hour, "minute": minute, "second": second,
-            "modifier": modifier, "group": group, "subgroup": subgroup,
-            "sequence": sequence, "side": side, "suffix": suffix,
-            "extension": extension,
-        }
-
-    def test_default_path_template(self):
-        formatter = Formatter()
-        parsed = self._create_parsed()
-        path = formatter.format_path(parsed)
-        assert path == "2024/2024.01.15"
-
-    def test_default_filename_template(self):
-        formatter = Formatter()
-        parsed = self._create_parsed()
-        filename = formatter.format_filename(parsed)
-        assert filename == "2024.01.15.10.30.45.E.FAM.POR.0001.A.RAW"
-
-    def test_custom_path_template_flat(self):
-        formatter = Formatter(archive_path_template="{year}.{month:02d}.{day:02d}")
-        parsed = self._create_parsed()
-        path = formatter.format_path(parsed)
-        assert path == "2024.01.15"
-
-    def test_custom_path_template_by_month(self):
-        formatter = Formatter(archive_path_template="{year}/{year}.{month:02d}")
-        parsed = self._create_parsed()
-        path = formatter.format_path(parsed)
-        assert path == "2024/2024.01"
-
-    def test_custom_path_template_by_group(self):
-        formatter = Formatter(archive_path_template="{group}/{year}/{year}.{month:02d}.{day:02d}")
-        parsed = self._create_parsed()
-        path = formatter.format_path(parsed)
-        assert path == "FAM/2024/2024.01.15"
-
-    def test_custom_filename_template_compact(self):
-        formatter = Formatter(
-            archive_filename_template="{year}{month:02d}{day:02d}_{hour:02d}{minute:02d}{second:02d}_{group}_{suffix}"
-        )
-        parsed = self._create_parsed()
+    @pytest.mark.parametrize("template, expected", [
+        (None, "2024/2024.01.15"),
+        ("{year}.{month:02d}.{day:02d}", "2024.01.15"),
+        ("{year}/{year}.{month:02d}", "2024/2024.01"),
+        ("{group}/{year}/{year}.{month:02d}.{day:02d}", "FAM/2024/2024.01.15"),
+    ])
+    def test_path_template(self, formatter_factory, default_parsed, template, expected):
+        formatter = formatter_factory(archive_path_template=template)
+        path = formatter.format_path(default_parsed)
+        assert path == expected
+
+    @pytest.mark.parametrize("template, expected", [
+        (None, "2024.01.15.10.30.45.E.FAM.POR.0001.A.RAW"),
+        (
+            "{year}{month:02d}{day:02d}_{hour:02d}{minute:02d}{second:02d}_{group}_{suffix}",
+            "20240115_103045_FAM_RAW",
+        ),
+        (
+            "{year}-{month:02d}-{day:02d}_{hour:02d}-{minute:02d}-{second:02d}_{modifier}_{group}_{subgroup}_{sequence:04d}_{side}_{suffix}",
+            "2024-01-15_10-30-45_E_FAM_POR_0001_A_RAW",
+        ),
+        ("{suffix}_{year}.{month:02d}.{day:02d}_{group}_{sequence:04d}", "RAW_2024.01.15_FAM_0001"),
+    ])
+    def test_filename_template(self, formatter_factory, default_parsed, template, expected):
+        formatter = formatter_factory(archive_filename_template=template)
+        filename = formatter.format_filename(default_parsed)
+        assert filename == expected
+
+    def test_sequence_formatting(self, formatter_factory, default_parsed):
+        formatter = formatter_factory()
+        parsed = {**default_parsed, "sequence": 42}
         filename = formatter.format_filename(parsed)
-        assert filename == "20240115_103045_FAM_RAW"
+        assert "0042" in filename
 
-    def test_custom_filename_template_iso_style(self):
-        formatter = Formatter(
-            archive_filename_template="{year}-{month:02d}-{day:02d}_{hour:02d}-{minute:02d}-{second:02d}_{modifier}_{group}_{subgroup}_{sequence:04d}_{side}_{suffix}"
-        )
-        parsed = self._create_parsed()
+    def test_padding_out_of_lookup_range(self, formatter_factory, default_parsed):
+        formatter = formatter_factory()
+        parsed = {**default_parsed, "year": 12345, "sequence": 123456}
         filename = formatter.format_filename(parsed)
-        assert filename == "2024-01-15_10-30-45_E_FAM_POR_0001_A_RAW"
+        assert filename == "12345.01.15.10.30.45.E.FAM.POR.123456.A.RAW"
 
-    def test_sequence_formatting(self):
-        formatter = Formatter()
-        parsed = self._create_parsed(sequence=42)
-        filename = formatter.format_filename(parsed)
-        assert "0042" in filename
+    def test_padding_spec_rejects_string_value(self, formatter_factory, default_parsed):
+        formatter = formatter_factory(archive_path_template="{group:02d}")
+        with pytest.raises(ValueError):
+            formatter.format_path(default_parsed)
 
-    def test_different_dates(self):
-        formatter = Formatter()
+    def test_different_dates(self, formatter_factory, default_parsed):
+        formatter = formatter_factory()
 
-        parsed_dec = self._create_parsed(year=2023, month=12, day=31)
+        parsed_dec = {**default_parsed, "year": 2023, "month": 12, "day": 31}
         path_dec = formatter.format_path(parsed_dec)
         assert path_dec == "2023/2023.12.31"
 
-        parsed_feb = self._create_parsed(year=2024, month=2, day=1)
+        parsed_feb = {**default_parsed, "year": 2024, "month": 2, "day": 1}
         path_feb = formatter.format_path(parsed_feb)
         assert path_feb == "2024/2024.02.01"
 
-    def test_all_components_available(self):
+    def test_all_components_available(self, formatter_factory, default_parsed):
         template = "{year}.{month}.{day}.{hour}.{minute}.{second}.{modifier}.{group}.{subgroup}.{sequence}.{side}.{suffix}.{extension}"
-        formatter = Formatter(archive_filename_template=template)
-        parsed = self._create_parsed()
-        filename = formatter.format_filename(parsed)
+        formatter = formatter_factory(archive_filename_template=template)
+        filename = formatter.format_filename(default_parsed)
 
         assert "2024" in filename
         assert "1" in filename
@@ -359,31 +382,25 @@ class TestFormatting:
         assert "RAW" in filename
         assert "tif" in filename
 
-    def test_path_template_without_year_folder(self):
-        formatter = Formatter(archive_path_template="{year}.{month:02d}.{day:02d}")
-        parsed = self._create_parsed()
-        path = formatter.format_path(parsed)
-        assert "/" not in path
-        assert path == "2024.01.15"
-
-    def test_filename_template_suffix_first(self):
-        formatter = Formatter(
-            archive_filename_template="{suffix}_{year}.{month:02d}.{day:02d}_{group}_{sequence:04d}"
-        )
-        parsed = self._create_parsed()
-        filename = formatter.format_filename(parsed)
-        assert filename == "RAW_2024.01.15_FAM_0001"
-
-    def test_extra_keys_available_in_template(self):
+    def test_extra_keys_available_in_template(self, formatter_factory, default_parsed):
         """Caller-added keys (e.g. exif_*) should be usable in custom templates."""
-        formatter = Formatter(
+        formatter = formatter_factory(
             archive_filename_template="{year}.{month:02d}.{day:02d}_{exif_camera}"
         )
-        parsed = self._create_parsed()
-        parsed["exif_camera"] = "Canon_EOS"
-        filename = formatter.format_filename(parsed)
+        default_parsed["exif_camera"] = "Canon_EOS"
+        filename = formatter.format_filename(default_parsed)
         assert filename == "2024.01.15_Canon_EOS"
 
+    def test_missing_field_raises_value_error(self, formatter_factory, default_parsed):
+        formatter = formatter_factory(archive_path_template="{year}/{exif_camera}")
+        with pytest.raises(ValueError, match="exif_camera"):
+            formatter.format_path(default_parsed)
+
+    def test_template_with_conversion_falls_back_to_str_format(self, formatter_factory, default_parsed):
+        formatter = formatter_factory(archive_filename_template="{{{group!r}}}_{sequence:04d}")
+        filename = formatter.format_filename(default_parsed)
+        assert filename == "{'FAM'}_0001"
+
 
 class TestSourceTemplate:
     """
@@ -489,6 +506,12 @@ class TestSourceTemplate:
         assert result["month"] == 0
         assert result["group"] == ""
 
+    def test_same_template_shares_compiled_pattern(self):
+        first = Formatter(source_filename_template="{year}.{group}.{extension}")
+        second = Formatter(source_filename_template="{year}.{group}.{extension}")
+
+        assert first._source_pattern is second._source_pattern
+
 
 class TestTemplateAwareValidation:
     """
@@ -5,20 +5,24 @@ Tests for common.router module (pattern-based routing).
 from pathlib import Path
 from typing import Any
 
+import pytest
+
 from common.router import Router
 
 
+_BASE_PARSED: dict[str, int | str] = {
+    "year": 2020, "month": 1, "day": 15,
+    "hour": 10, "minute": 0, "second": 0,
+    "modifier": "E", "group": "FAM", "subgroup": "POR",
+    "sequence": 1, "side": "A",
+}
+
+
 class TestRouter:
     """Tests for Router with pattern-based routing rules."""
 
     def _create_parsed(self, suffix: str, extension: str = "tif") -> dict[str, int | str]:
-        return {
-            "year": 2020, "month": 1, "day": 15,
-            "hour": 10, "minute": 0, "second": 0,
-            "modifier": "E", "group": "FAM", "subgroup": "POR",
-            "sequence": 1, "side": "A",
-            "suffix": suffix, "extension": extension,
-        }
+        return {**_BASE_PARSED, "suffix": suffix, "extension": extension}
 
     def test_default_routing_raw_to_sources(self) -> None:
         """RAW files should go to SOURCES/ with default routing."""
@@ -180,6 +184,15 @@ class TestRouter:
         assert target_jan == Path("/archive/2020/2020.01.15/SOURCES")
         assert target_dec == Path("/archive/2020/2020.12.31/SOURCES")
 
+    def test_empty_path_template_stays_under_base(self) -> None:
+        """An empty archive path template routes straight into base_path."""
+        router = Router(formats={"archive_path_template": ""})
+        base_path = Path("/archive")
+
+        target, _ = router.get_target_folder(self._create_parsed("RAW"), base_path)
+
+        assert target == Path("/archive/SOURCES")
+
     def test_get_folders_for_patterns_default(self) -> None:
         """get_folders_for_patterns should return correct folders for default routes."""
         router = Router()
@@ -234,8 +247,6 @@ class TestRouter:
 
     def test_raises_when_no_pattern_matches(self) -> None:
         """When no rule matches, Router should raise ValueError."""
-        import pytest
-
         routes_without_catchall = {"rules": [
             ["*.RAW.*", "SOURCES"],
         ]}
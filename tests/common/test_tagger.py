@@ -7,8 +7,22 @@ import pytest
 from common.exifer import Exifer
 from common.tagger import Tagger
 from common.tags import KeyValueTag, HistoryTag
-from common.constants import TAG_XMP_XMPMM_DOCUMENT_ID, TAG_XMP_XMPMM_INSTANCE_ID, XMP_ACTION_CREATED
-from tests.common.test_utils import create_test_image
+from common.constants import TAG_XMP_XMPMM_DOCUMENT_ID, TAG_XMP_XMPMM_HISTORY, TAG_XMP_XMPMM_INSTANCE_ID, XMP_ACTION_CREATED, XMP_ACTION_EDITED
+from tests.common.fake_exifer import FakeExifer
+from tests.common.test_utils import TIFF_1X1_RED_BYTES
+
+
+def _entries_by_instance(history: list[dict]) -> dict[str, list[dict]]:
+    """
+    Group parsed History entries by instanceID, keeping every entry.
+
+    A created and an edited entry often share one instanceID.
+    """
+    grouped: dict[str, list[dict]] = {}
+    for entry in history:
+        if "instanceID" in entry:
+            grouped.setdefault(entry["instanceID"], []).append(entry)
+    return grouped
 
 
 @pytest.mark.usefixtures("require_exiftool")
@@ -22,7 +36,7 @@ class TestTagger:
         Create a minimal test image without scan-batcher metadata.
         """
         file_path = tmp_path / "sample.tiff"
-        create_test_image(file_path, size=(1, 1), format="TIFF", add_ids=False)
+        file_path.write_bytes(TIFF_1X1_RED_BYTES)
         return file_path
 
     def test_write_and_read_history(self, tmp_path):
@@ -50,7 +64,7 @@ class TestTagger:
         tagger2 = Tagger(file_path, exifer=ex)
         history = tagger2.read(HistoryTag())
         assert isinstance(history, list)
-        assert any(entry.get("instanceID") == instance for entry in history)
+        assert instance in _entries_by_instance(history)
 
     def test_batch_read(self, tmp_path):
         """
@@ -101,3 +115,41 @@ class TestTagger:
         tagger2.read(KeyValueTag("SomeTag"))
         with pytest.raises(RuntimeError, match="Cannot mix"):
             tagger2.write(KeyValueTag("SomeTag", "value"))
+
+
+class TestHistoryTag:
+    """
+    Unit tests for HistoryTag parsing (no exiftool needed).
+    """
+
+    def test_parse_keeps_entries_sharing_an_instance_id(self):
+        history = HistoryTag().parse({
+            "XMP-xmpMM:HistoryAction": ["created", "edited", "converted"],
+            "XMP-xmpMM:HistoryInstanceID": ["aaa", "aaa", "bbb"],
+        })
+
+        assert isinstance(history, list)
+        assert len(history) == 3
+        grouped = _entries_by_instance(history)
+        assert [entry["action"] for entry in grouped["aaa"]] == ["created", "edited"]
+        assert [entry["action"] for entry in grouped["bbb"]] == ["converted"]
+
+    def test_batched_entries_are_appended_in_one_write(self):
+        writes: list[dict] = []
+
+        class RecordingExifer(FakeExifer):
+            def write(self, file_path, tags, overwrite_original=True, timeout=None):
+                writes.append(tags)
+                return True
+
+        when = datetime.now(timezone.utc)
+        tagger = Tagger(Path("dummy.tif"), exifer=RecordingExifer())
+        tagger.begin()
+        tagger.write(HistoryTag(action=XMP_ACTION_CREATED, when=when, instance_id="aaa"))
+        tagger.write(HistoryTag(action=XMP_ACTION_EDITED, when=when, instance_id="bbb"))
+        tagger.end()
+
+        assert len(writes) == 1
+        entries = writes[0][TAG_XMP_XMPMM_HISTORY + "+"]
+        assert len(entries) == 2
+        assert "instanceID=bbb" in entries[1]
@@ -2,37 +2,151 @@
 Common test utilities for creating test fixtures.
 """
 
+import json
+import os
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+from typing import Any, Literal
 
-from PIL import Image
-
-from common.constants import TAG_IFD0_MAKE, TAG_IFD0_MODEL, TAG_IFD0_SOFTWARE, TAG_EXIFIFD_CREATE_DATE
+from common.constants import TAG_IFD0_MAKE, TAG_IFD0_MODEL, TAG_IFD0_SOFTWARE, TAG_EXIFIFD_CREATE_DATE, TAG_XMP_XMPMM_DOCUMENT_ID, TAG_XMP_XMPMM_INSTANCE_ID
 from common.logger import Logger
 from tests.common.fake_exifer import FakeExifer
 from tests.scan_batcher.fake_metadata_workflow import FakeMetadataWorkflow
 
 
+# Uncompressed 1x1 red RGB TIFF, byte-identical to what PIL writes for
+# Image.new("RGB", (1, 1), "red").save(..., format="TIFF").
+TIFF_1X1_RED_BYTES = (
+    b"II*\x00\x08\x00\x00\x00"  # header: little-endian, IFD at offset 8
+    b"\x0a\x00"  # 10 IFD entries
+    b"\x00\x01\x04\x00\x01\x00\x00\x00\x01\x00\x00\x00"  # ImageWidth = 1
+    b"\x01\x01\x04\x00\x01\x00\x00\x00\x01\x00\x00\x00"  # ImageLength = 1
+    b"\x02\x01\x03\x00\x03\x00\x00\x00\x86\x00\x00\x00"  # BitsPerSample -> offset 134
+    b"\x03\x01\x03\x00\x01\x00\x00\x00\x01\x00\x00\x00"  # Compression = none
+    b"\x06\x01\x03\x00\x01\x00\x00\x00\x02\x00\x00\x00"  # PhotometricInterpretation = RGB
+    b"\x11\x01\x04\x00\x01\x00\x00\x00\x8c\x00\x00\x00"  # StripOffsets = 140
+    b"\x15\x01\x03\x00\x01\x00\x00\x00\x03\x00\x00\x00"  # SamplesPerPixel = 3
+    b"\x16\x01\x04\x00\x01\x00\x00\x00\x01\x00\x00\x00"  # RowsPerStrip = 1
+    b"\x17\x01\x04\x00\x01\x00\x00\x00\x03\x00\x00\x00"  # StripByteCounts = 3
+    b"\x1c\x01\x03\x00\x01\x00\x00\x00\x01\x00\x00\x00"  # PlanarConfiguration = chunky
+    b"\x00\x00\x00\x00"  # next IFD offset: none
+    b"\x08\x00\x08\x00\x08\x00"  # BitsPerSample values: 8, 8, 8
+    b"\xff\x00\x00"  # pixel data: (255, 0, 0)
+)
+
+
+@lru_cache(maxsize=1)
+def _default_workflow() -> FakeMetadataWorkflow:
+    """
+    Return the shared FakeMetadataWorkflow used when callers pass none.
+    """
+    return FakeMetadataWorkflow(Logger("test", console=False))
+
+
+@lru_cache(maxsize=1)
 def exiftool_available() -> bool:
     """
     Return True if exiftool is installed and runnable.
+
+    The probe starts (or fails to start) the shared exiftool process, so
+    the answer is cached for the rest of the run.
     """
     return FakeExifer.is_available()
 
 
+def read_exiftool_json(path: str | Path, tags: list[str] | None = None) -> dict[str, Any]:
+    """
+    Read metadata of a file as exiftool ``-json -G`` output.
+
+    Goes through the shared stay_open exiftool process instead of spawning
+    a new exiftool per read.
+
+    Args:
+        path: File to read.
+        tags: Tag names (without group) to extract. When given, exiftool
+            runs with ``-fast2`` and only these tags are decoded; absent
+            tags are simply missing from the result. By default every tag
+            is returned.
+    """
+    args = ["-G"]
+    if tags:
+        args.append("-fast2")
+        args.extend(f"-{tag}" for tag in tags)
+    return FakeExifer()._read_json(path, args)
+
+
+def read_exiftool_json_batch(paths: list[Path]) -> list[dict[str, Any]]:
+    """
+    Read several files with a single exiftool ``-json -G`` call.
+
+    Records are returned in the order of *paths*.
+    """
+    output = FakeExifer()._run(["-json", "-G", *(os.fspath(path) for path in paths)])
+    return json.loads(output)
+
+
+def first_present(meta: dict[str, Any], *keys: str) -> Any:
+    """
+    Return the value of the first key present in *meta*, or ``None``.
+
+    exiftool reports the same tag under different group names depending on
+    the file and the ``-G`` level, so assertions try several spellings.
+    """
+    return next((meta[key] for key in keys if key in meta), None)
+
+
+@lru_cache(maxsize=16)
+def _image_format_for_suffix(suffix: str) -> str:
+    """
+    Return the PIL format name for a file suffix (e.g. ``.tiff`` -> ``TIFF``).
+    """
+    from PIL import Image
+
+    format = Image.registered_extensions().get(suffix.lower())
+    if format is None:
+        raise ValueError(f"Unknown image extension: {suffix}")
+    return format
+
+
+@lru_cache(maxsize=16)
+def encoded_image_bytes(
+    size: tuple[int, int],
+    color: str | tuple[int, int, int],
+    format: str,
+) -> bytes:
+    """
+    Encode a solid-color grayscale image once and return its bytes.
+
+    Tests only assert on metadata and dimensions, so images are stored as
+    8-bit "L" (the color is reduced to its luminance) to keep encoding and
+    files a third of the RGB size. The output is deterministic for a given
+    (size, color, format), so repeated fixtures reuse the cached bytes.
+    """
+    from PIL import Image
+
+    buffer = BytesIO()
+    # "L" images only take a single gray value, so fill in RGB and convert.
+    Image.new("RGB", size, color=color).convert("L").save(buffer, format=format)
+    return buffer.getvalue()
+
+
 def create_test_image(
     path: Path,
-    size: tuple[int, int] = (100, 100),
-    color: str | tuple[int, ...] = "red",
+    size: tuple[int, int] = (16, 16),
+    color: str | tuple[int, int, int] = "red",
     format: str | None = None,
     add_ids: bool = True,
     scanner_make: str = "Test Scanner",
     scanner_model: str = "Test Model",
+    metadata_profile: Literal["minimal", "full"] = "full",
 ) -> None:
     """
     Create a test image with optional scanner metadata.
     
-    Creates a PIL image and optionally writes scanner metadata that mirrors
+    Writes a solid-color image (encoded once per size/color/format and
+    cached) and optionally adds scanner metadata that mirrors
     the real scanning workflow:
     1. VueScan EXIF tags (Make, Model, Software, CreateDate without timezone)
     2. scan-batcher metadata via FakeMetadataWorkflow (DocumentID, InstanceID,
@@ -40,22 +154,68 @@ def create_test_image(
     
     Args:
         path: Path where to save the image.
-        size: Image size as (width, height).
+        size: Image size as (width, height). Kept small by default since
+            most tests only assert on metadata.
         color: Fill color (name or RGB tuple).
         format: Image format (TIFF, JPEG, etc). If None, inferred from extension.
-        add_ids: If True, add full scanner metadata (VueScan + scan-batcher).
+        add_ids: If True, add metadata according to ``metadata_profile``.
         scanner_make: Scanner manufacturer (default: "Test Scanner").
         scanner_model: Scanner model (default: "Test Model").
+        metadata_profile: ``"full"`` adds VueScan + scan-batcher metadata;
+            ``"minimal"`` only writes DocumentID/InstanceID, which is all
+            file-organizer requires.
     """
-    img = Image.new("RGB", size, color=color)
-    
-    if format:
-        img.save(path, format=format)
-    else:
-        img.save(path)
+    if not format:
+        format = _image_format_for_suffix(path.suffix)
+
+    path.write_bytes(encoded_image_bytes(size, color, format))
     
     if add_ids:
-        add_scanner_metadata(path, scanner_make=scanner_make, scanner_model=scanner_model)
+        if metadata_profile == "minimal":
+            add_required_ids(path)
+        else:
+            add_scanner_metadata(path, scanner_make=scanner_make, scanner_model=scanner_model)
+
+
+def create_test_images(paths: list[Path], **kwargs: Any) -> None:
+    """
+    Create several test images sharing the same options.
+
+    All image files are written first, then scanner metadata is added to
+    each one. Both phases reuse the cached encoding and the shared
+    exiftool process, so callers that need a group of related files
+    (e.g. RAW + MSR of one frame) avoid interleaving PIL and exiftool work.
+
+    Args:
+        paths: Paths where to save the images.
+        **kwargs: Options forwarded to :func:`create_test_image`.
+    """
+    add_ids = kwargs.pop("add_ids", True)
+    scanner_make = kwargs.pop("scanner_make", "Test Scanner")
+    scanner_model = kwargs.pop("scanner_model", "Test Model")
+    metadata_profile = kwargs.pop("metadata_profile", "full")
+    for path in paths:
+        create_test_image(path, add_ids=False, **kwargs)
+    if not add_ids:
+        return
+    for path in paths:
+        if metadata_profile == "minimal":
+            add_required_ids(path)
+        else:
+            add_scanner_metadata(path, scanner_make=scanner_make, scanner_model=scanner_model)
+
+
+def add_required_ids(path: Path) -> None:
+    """
+    Write only the DocumentID and InstanceID a scanned file must carry.
+
+    Args:
+        path: Path to the file to add identifiers to.
+    """
+    FakeExifer().write(path, {
+        TAG_XMP_XMPMM_DOCUMENT_ID: os.urandom(16).hex(),
+        TAG_XMP_XMPMM_INSTANCE_ID: os.urandom(16).hex(),
+    })
 
 
 def add_scanner_metadata(
@@ -63,6 +223,7 @@ def add_scanner_metadata(
     scanner_make: str = "Test Scanner",
     scanner_model: str = "Test Model",
     scanner_software: str = "VueScan 9 x64 (9.8.50)",
+    workflow: FakeMetadataWorkflow | None = None,
 ) -> None:
     """
     Add scanner metadata matching the real scanning workflow.
@@ -81,14 +242,17 @@ def add_scanner_metadata(
         - Exif:OffsetTimeDigitized (timezone offset)
         - XMP History entries (created + edited actions)
     
-    This ensures tests use the same code paths as production, so tag formats
-    (timestamps, timezone handling, etc.) are identical.
+    Both phases are computed in memory and flushed to the file in a single
+    exiftool call. Phase 2 still goes through the production tag builder,
+    so tag formats (timestamps, timezone handling, etc.) are identical.
     
     Args:
         path: Path to the file to add metadata to.
         scanner_make: Scanner manufacturer (default: "Test Scanner").
         scanner_model: Scanner model (default: "Test Model").
         scanner_software: Scanner software (default: "VueScan 9 x64 (9.8.50)").
+        workflow: Workflow used to build the scan-batcher tags. Defaults to
+            a shared instance created on first use.
     """
     exifer = FakeExifer()
     
@@ -104,12 +268,11 @@ def add_scanner_metadata(
         TAG_EXIFIFD_CREATE_DATE: create_date,
     }
     
-    exifer.write(path, vuescan_tags)
-    
     # === Phase 2: Simulate scan-batcher metadata via real MetadataWorkflow ===
-    # Uses the same code path as production: reads existing tags, enriches
-    # DateTimeDigitized with timezone, generates IDs, writes XMP History
-    logger = Logger("test", console=False)
-    workflow = FakeMetadataWorkflow(logger)
-    file_datetime = workflow.get_digitized_datetime(path)
-    workflow.write_xmp_metadata(path, file_datetime)
+    # Production re-reads CreateDate and localizes it; we already hold the
+    # value, so localize it directly (second precision, as read back).
+    file_datetime = now.replace(microsecond=0).astimezone()
+    workflow = workflow or _default_workflow()
+    xmp_tags = workflow.build_xmp_tags(path, file_datetime, vuescan_tags)
+    
+    exifer.write(path, vuescan_tags | xmp_tags)
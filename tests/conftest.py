@@ -36,12 +36,28 @@ def logger() -> Logger:
     return Logger("test")
 
 
-@pytest.fixture
-def require_exiftool() -> None:
+@pytest.fixture(scope="session")
+def session_logger() -> Logger:
     """
-    Skip the test if exiftool is not installed or not runnable.
+    Create a quiet logger shared by the whole test session.
+    """
+    return Logger("test", console=False)
+
+
+@pytest.fixture(scope="session")
+def _exiftool_available() -> bool:
+    """
+    Probe for exiftool once per session.
     """
     from tests.common.test_utils import exiftool_available
 
-    if not exiftool_available():
+    return exiftool_available()
+
+
+@pytest.fixture
+def require_exiftool(_exiftool_available: bool) -> None:
+    """
+    Skip the test if exiftool is not installed or not runnable.
+    """
+    if not _exiftool_available:
         pytest.skip("ExifTool not found")
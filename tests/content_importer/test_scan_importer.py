@@ -13,7 +13,7 @@ from common.tagger import Tagger
 from common.tags import HistoryTag
 from common.constants import TAG_XMP_XMPMM_HISTORY
 from content_importer.scan_importer import ScanImporter
-from tests.common.test_utils import create_test_image
+from tests.common.test_utils import create_test_image, first_present
 
 
 VALID_NAME_1 = "2024.03.15.10.30.00.E.FAM.POR.0001.A.MSR.tif"
@@ -164,13 +164,13 @@ class TestScansImporter:
         placed = next(archive.rglob("*.tif"))
         meta = Exifer().read(placed, [])
 
-        archive_identifier = meta.get(TAG_XMP_DC_IDENTIFIER) or meta.get(TAG_XMP_XMP_IDENTIFIER)
+        archive_identifier = first_present(meta, TAG_XMP_DC_IDENTIFIER, TAG_XMP_XMP_IDENTIFIER)
         assert archive_identifier, "Imported master must have an archive identifier"
 
-        dt_original = meta.get(TAG_EXIF_DATETIME_ORIGINAL) or meta.get("ExifIFD:DateTimeOriginal") or meta.get("EXIF:DateTimeOriginal")
+        dt_original = first_present(meta, TAG_EXIF_DATETIME_ORIGINAL, "ExifIFD:DateTimeOriginal", "EXIF:DateTimeOriginal")
         assert dt_original == "2024:03:15 10:30:00"
 
-        date_created = meta.get(TAG_XMP_PHOTOSHOP_DATE_CREATED) or meta.get("XMP:DateCreated")
+        date_created = first_present(meta, TAG_XMP_PHOTOSHOP_DATE_CREATED, "XMP:DateCreated")
         assert date_created is not None
         assert "2024-03-15T10:30:00" in str(date_created) or "2024:03:15 10:30:00" in str(date_created)
 
@@ -188,10 +188,10 @@ class TestScansImporter:
         placed = next(archive.rglob("*.tif"))
         meta = Exifer().read(placed, [])
 
-        dt_original = meta.get(TAG_EXIF_DATETIME_ORIGINAL) or meta.get("ExifIFD:DateTimeOriginal") or meta.get("EXIF:DateTimeOriginal")
+        dt_original = first_present(meta, TAG_EXIF_DATETIME_ORIGINAL, "ExifIFD:DateTimeOriginal", "EXIF:DateTimeOriginal")
         assert not dt_original
 
-        date_created = meta.get(TAG_XMP_PHOTOSHOP_DATE_CREATED) or meta.get("XMP:DateCreated")
+        date_created = first_present(meta, TAG_XMP_PHOTOSHOP_DATE_CREATED, "XMP:DateCreated")
         assert date_created is not None
         assert str(date_created).startswith("1950")
 
@@ -362,12 +362,12 @@ class TestScansImporter:
         placed = next(archive.rglob("*.tif"))
         meta = Exifer().read(placed, [])
 
-        description = meta.get(TAG_XMP_DC_DESCRIPTION) or meta.get("XMP:Description")
-        rights = meta.get(TAG_XMP_DC_RIGHTS) or meta.get("XMP:Rights")
-        source_value = meta.get(TAG_XMP_DC_SOURCE) or meta.get("XMP:Source")
-        credit = meta.get(TAG_XMP_PHOTOSHOP_CREDIT) or meta.get("XMP:Credit")
-        terms = meta.get(TAG_XMP_XMPRIGHTS_USAGE_TERMS) or meta.get("XMP:UsageTerms")
-        marked = meta.get(TAG_XMP_XMPRIGHTS_MARKED) or meta.get("XMP:Marked")
+        description = first_present(meta, TAG_XMP_DC_DESCRIPTION, "XMP:Description")
+        rights = first_present(meta, TAG_XMP_DC_RIGHTS, "XMP:Rights")
+        source_value = first_present(meta, TAG_XMP_DC_SOURCE, "XMP:Source")
+        credit = first_present(meta, TAG_XMP_PHOTOSHOP_CREDIT, "XMP:Credit")
+        terms = first_present(meta, TAG_XMP_XMPRIGHTS_USAGE_TERMS, "XMP:UsageTerms")
+        marked = first_present(meta, TAG_XMP_XMPRIGHTS_MARKED, "XMP:Marked")
 
         assert description is not None
         assert "Русское описание" in str(description)
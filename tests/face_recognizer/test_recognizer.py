@@ -12,6 +12,7 @@ from face_recognizer.classes import DetectedFace, RecognizerSettings
 from face_recognizer.detector import FaceDetector, detector, register_detector_class
 from face_recognizer.recognizer import Recognizer
 from face_recognizer.store import RecognizerStore
+from tests.common.test_utils import create_test_image
 
 
 @detector("detector-test")
@@ -52,8 +53,8 @@ class TestRecognizer:
             msr_file = date_dir / "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff"
             raw_file = date_dir / "1950.06.15.12.00.00.E.FAM.POR.0001.A.RAW.tiff"
             ignored = date_dir / "notes.txt"
-            Image.new("RGB", (100, 100), color="white").save(msr_file)
-            Image.new("RGB", (100, 100), color="white").save(raw_file)
+            create_test_image(msr_file, size=(100, 100), color="white", add_ids=False)
+            create_test_image(raw_file, size=(100, 100), color="white", add_ids=False)
             ignored.write_text("ignore me", encoding="utf-8")
 
             settings = RecognizerSettings.from_data(detector="detector-test")
@@ -80,8 +81,8 @@ class TestRecognizer:
 
             msr_file = date_dir / "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff"
             raw_file = date_dir / "1950.06.15.12.00.00.E.FAM.POR.0001.A.RAW.tiff"
-            Image.new("RGB", (100, 100), color="white").save(msr_file)
-            Image.new("RGB", (100, 100), color="white").save(raw_file)
+            create_test_image(msr_file, size=(100, 100), color="white", add_ids=False)
+            create_test_image(raw_file, size=(100, 100), color="white", add_ids=False)
 
             settings = RecognizerSettings.from_data(
                 detector="detector-test",
@@ -103,7 +104,7 @@ class TestRecognizer:
             source_dir.mkdir(parents=True, exist_ok=True)
 
             source_file = source_dir / "1950.06.15.12.00.00.E.FAM.POR.0001.A.RAW.tiff"
-            Image.new("RGB", (100, 100), color="white").save(source_file)
+            create_test_image(source_file, size=(100, 100), color="white", add_ids=False)
 
             settings = RecognizerSettings.from_data(detector="detector-test")
             recognizer = Recognizer(Logger("test_recognizer_thumbs"), settings=settings)
@@ -145,7 +146,7 @@ class TestRecognizer:
             source_dir.mkdir(parents=True, exist_ok=True)
 
             source_file = source_dir / "1950.06.15.12.00.00.E.FAM.POR.0001.A.RAW.tiff"
-            Image.new("RGB", (100, 100), color="white").save(source_file)
+            create_test_image(source_file, size=(100, 100), color="white", add_ids=False)
 
             first_batch = [
                 DetectedFace(
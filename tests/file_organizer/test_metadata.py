@@ -75,14 +75,13 @@ class TestGetMetadataValues:
 
         assert values == {}
 
-    def test_returns_empty_dict_when_languages_empty(self) -> None:
+    def test_returns_empty_dict_when_languages_empty(self, session_logger: Logger) -> None:
         """
         Returns empty dict when languages is empty.
         """
-        logger = Logger("test", console=False)
-        am = ArchiveMetadata(metadata={"languages": {}}, logger=logger)
+        am = ArchiveMetadata(metadata={"languages": {}}, logger=session_logger)
 
-        values = am.get_metadata_values(logger=logger)
+        values = am.get_metadata_values(logger=session_logger)
 
         assert values == {}
 
@@ -247,3 +246,45 @@ class TestGetMetadataValues:
         assert values["Custom:Description"] == "Test"
         assert values["Custom:Rights"] == "© 2026"
         assert "XMP-dc:Description" not in values  # Not using default tag
+
+    def test_repeated_calls_return_independent_copies(self) -> None:
+        """
+        Cached values are returned as fresh dicts so callers cannot corrupt them.
+        """
+        am = ArchiveMetadata(metadata={
+            "tags": DEFAULT_METADATA["tags"],
+            "languages": {
+                "en-US": {
+                    "default": True,
+                    "description": "Test",
+                }
+            },
+        })
+
+        first = am.get_metadata_values()
+        first["XMP-dc:Description"] = "changed"
+        second = am.get_metadata_values()
+
+        assert second["XMP-dc:Description"] == "Test"
+        assert second is not first
+
+    def test_repeated_calls_do_not_share_list_values(self) -> None:
+        """
+        Mutating a returned Creator list does not leak into later calls.
+        """
+        am = ArchiveMetadata(metadata={
+            "tags": DEFAULT_METADATA["tags"],
+            "languages": {
+                "en-US": {
+                    "default": True,
+                    "creator": ["John Doe"],
+                }
+            },
+        })
+
+        first = am.get_metadata_values()
+        creator_tag = next(tag for tag, value in first.items() if isinstance(value, list))
+        first[creator_tag].append("Intruder")
+        second = am.get_metadata_values()
+
+        assert second[creator_tag] == ["John Doe"]
@@ -1,73 +1,281 @@
 """
 Tests for FileOrganizer class.
+
+Tests are independent of each other and can run in parallel with
+``pytest -n auto --dist loadgroup tests/file_organizer/``. Every xdist
+worker is a separate process, so each one keeps its own stay_open
+exiftool session.
 """
 
 import json
 import os
+import re
 import shutil
-import subprocess
-import tempfile
-import uuid
+import stat
 from pathlib import Path
 from datetime import datetime, timezone
+from unittest.mock import patch
 
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 import pytest
 
 from file_organizer.organizer import FileOrganizer
+from file_organizer.processor import FileProcessor
 from file_organizer.constants import DEFAULT_METADATA
 from common.project_config import ProjectConfig
 from common.constants import DEFAULT_CONFIG, TAG_XMP_XMPMM_INSTANCE_ID, TAG_XMP_XMPMM_DOCUMENT_ID, TAG_XMP_XMP_CREATOR_TOOL, TAG_XMP_XMPMM_HISTORY, XMP_ACTION_CREATED, XMP_ACTION_EDITED
 from common.logger import Logger
 from common.exifer import Exifer
 from common.tagger import Tagger
-from common.tags import HistoryTag
+from common.tags import HistoryTag, KeyValueTag
+from tests.common.test_utils import create_test_image, first_present, read_exiftool_json
+
+
+pytestmark = pytest.mark.usefixtures("require_exiftool")
+
+
+# Organizer config with the required metadata languages; read-only and shared.
+_MINIMAL_CONFIG: Mapping[str, Any] = MappingProxyType({
+    "metadata": {
+        "languages": {
+            "en-US": {
+                "default": True,
+                "creator": "Test Author",
+                "credit": "Test Archive",
+                "rights": "Test Rights",
+                "terms": "Test Terms",
+                "source": "Test Source",
+                "description": "Test description",
+            }
+        }
+    }
+})
+_MINIMAL_CONFIG_JSON = json.dumps(dict(_MINIMAL_CONFIG)).encode("utf-8")
+
+# Group-qualified spellings under which exiftool reports the date tags.
+_DATE_TIME_ORIGINAL_KEYS = ("ExifIFD:DateTimeOriginal", "EXIF:DateTimeOriginal")
+_DATE_CREATED_KEYS = ("XMP:DateCreated", "XMP-photoshop:DateCreated")
+
+# "uuid:" prefixes and dashes that exiftool may add around written IDs.
+_UUID_NOISE = re.compile(r"uuid:|-")
+
+# One file per date modifier, with the archive folder it must land in.
+_DATE_MODIFIER_SCENARIOS: list[Mapping[str, str]] = [
+    MappingProxyType({
+        "name": "Exact Date",
+        "filename": "2023.10.27.12.00.00.E.Group.Sub.0001.A.Orig.jpg",
+        "expected_subpath": "2023/2023.10.27/DERIVATIVES",
+    }),
+    MappingProxyType({
+        "name": "Circa Year",
+        "filename": "1950.00.00.00.00.00.C.Group.Sub.0002.A.Orig.jpg",
+        "expected_subpath": "1950/1950.00.00/DERIVATIVES",
+    }),
+    MappingProxyType({
+        "name": "Before Year-Month",
+        "filename": "1960.01.00.00.00.00.B.Group.Sub.0003.A.Orig.jpg",
+        "expected_subpath": "1960/1960.01.00/DERIVATIVES",
+    }),
+    MappingProxyType({
+        "name": "After Year-Month-Day",
+        "filename": "1970.05.20.00.00.00.F.Group.Sub.0004.A.Orig.jpg",
+        "expected_subpath": "1970/1970.05.20/DERIVATIVES",
+    }),
+    MappingProxyType({
+        "name": "Absent Date",
+        "filename": "0000.00.00.00.00.00.A.Group.Sub.0005.A.Orig.jpg",
+        "expected_subpath": "0000/0000.00.00/DERIVATIVES",
+    }),
+]
+_DATE_MODIFIER_CONFIG_JSON = json.dumps({
+    "metadata": {
+        "languages": {
+            "en-US": {
+                "default": True,
+                "creator": "Test User",
+                "rights": "Public Domain",
+            }
+        }
+    }
+}).encode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def organizer(session_logger: Logger) -> FileOrganizer:
+    """
+    Share one FileOrganizer built from the default project config.
+
+    The Router reads routes and formats from the ProjectConfig singleton
+    at construction, so the default config is installed first instead of
+    inheriting whatever an earlier module left behind. Each test passes
+    its own config_path, which selects the processor for that run.
+    """
+    ProjectConfig.instance(data=DEFAULT_CONFIG)
+    return FileOrganizer(session_logger)
+
+
+@pytest.fixture(scope="module")
+def exifer() -> Exifer:
+    """
+    Share one Exifer; it only wraps the shared stay_open process.
+    """
+    return Exifer()
+
+
+@pytest.fixture(scope="module")
+def tagged_base_image(tmp_path_factory: pytest.TempPathFactory, exifer: Exifer) -> tuple[Path, str, str, str]:
+    """
+    Create one JPEG carrying XMP identifiers, CreatorTool and history.
+
+    The date-modifier scenarios copy it under their own filenames, so the
+    tags are written once instead of per scenario.
+
+    Returns:
+        (image path, InstanceID, DocumentID, CreatorTool).
+    """
+    path = tmp_path_factory.mktemp("tagged") / "base.jpg"
+    create_test_image(path, add_ids=False)
+
+    instance = os.urandom(16).hex()
+    document = os.urandom(16).hex()
+    creator = "test-organizer"
+
+    # Write identifiers, CreatorTool and history entries in one exiftool call
+    created_when = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+    tagger = Tagger(path, exifer=exifer)
+    tagger.begin()
+    tagger.write(KeyValueTag(TAG_XMP_XMPMM_INSTANCE_ID, instance))
+    tagger.write(KeyValueTag(TAG_XMP_XMPMM_DOCUMENT_ID, document))
+    tagger.write(KeyValueTag(TAG_XMP_XMP_CREATOR_TOOL, creator))
+    tagger.write(HistoryTag(
+        action=XMP_ACTION_CREATED,
+        when=created_when,
+        software_agent="test-organizer",
+        instance_id=instance,
+    ))
+    tagger.write(HistoryTag(
+        action=XMP_ACTION_EDITED,
+        when=datetime.now(timezone.utc),
+        software_agent="test-organizer",
+        changed="metadata",
+        instance_id=instance,
+    ))
+    tagger.end()
+
+    return path, instance, document, creator
+
+
+@pytest.fixture(scope="module")
+def minimal_config_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Write the minimal organizer config once and share its path.
+
+    The organizer only reads the file, and keeping it outside the input
+    folder keeps it out of the batch totals.
+    """
+    path = tmp_path_factory.mktemp("configs") / "minimal.json"
+    path.write_bytes(_MINIMAL_CONFIG_JSON)
+    return path
+
+
+@pytest.fixture(scope="module")
+def date_modifier_config_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Write the date-modifier scenarios' config once and share its path.
+    """
+    path = tmp_path_factory.mktemp("configs") / "date_modifier.json"
+    path.write_bytes(_DATE_MODIFIER_CONFIG_JSON)
+    return path
+
+
+@pytest.fixture(scope="module")
+def processed_tiff(organizer: FileOrganizer, tmp_path_factory: pytest.TempPathFactory) -> tuple[dict[str, int], Path, Path, dict[str, Any]]:
+    """
+    Organize one exact-date MSR TIFF with a full metadata config.
+
+    The checks on placement and on individual tags share this single run.
+
+    Returns:
+        (batch result, source path, processed path, exiftool metadata).
+    """
+    root = tmp_path_factory.mktemp("processed_tiff")
+    input_dir = root / "input"
+    input_dir.mkdir()
+    output_dir = root / "output"
+
+    # Metadata lives in file-organizer config, not in ProjectConfig
+    config_path = root / "config.json"
+    config_path.write_bytes(json.dumps({
+        "metadata": {
+            "tags": DEFAULT_METADATA["tags"],
+            "languages": {
+                "en-US": {
+                    "default": True,
+                    "creator": "John Doe",
+                    "credit": "The Archive",
+                    "rights": "Public Domain",
+                    "terms": "Free to use",
+                    "source": "Box 42",
+                    "description": "Test description for 1950-06-15 image",
+                }
+            },
+        }
+    }).encode("utf-8"))
 
+    filename = "1950.06.15.12.30.45.E.FAM.POR.0001.A.MSR.tiff"
+    source_path = input_dir / filename
+    create_test_image(source_path, metadata_profile="full")
 
-def _rmtree_force(path: Path) -> None:
-    """Remove a directory tree, resetting read-only flags when necessary."""
-    def _on_rm_error(_func: Any, p: str, _exc_info: Any) -> None:
-        os.chmod(p, 0o700)
-        os.unlink(p)
-    shutil.rmtree(path, onerror=_on_rm_error)
-from tests.common.test_utils import create_test_image
+    result = organizer(
+        input_path=input_dir,
+        output_path=output_dir,
+        config_path=config_path,
+        recursive=False,
+        copy_mode=False,
+    )
 
+    # 1950 / 1950.06.15 / SOURCES
+    processed_path = output_dir / "1950" / "1950.06.15" / "SOURCES" / filename
+    return result, source_path, processed_path, read_exiftool_json(processed_path)
 
+
+@pytest.mark.xdist_group("organizer_unit")
 class TestFileOrganizer:
     """
     Test cases for FileOrganizer processing API.
     """
 
-    def test_should_process_delegation(self, logger: Logger) -> None:
+    @pytest.mark.parametrize("path,expected", [
+        (Path('1950.06.15.12.00.00.E.FAM.POR.000001.A.MSR.tiff'), True),
+        # Filename validation is separate; only the extension matters here
+        (Path('invalid.jpg'), True),
+        (Path('1950.06.15.12.00.00.E.FAM.POR.000001.A.MSR.TIFF'), True),
+        (Path('file.txt'), False),
+        (Path('/archive/output/1950/1950.06.15.12.00.00.E.FAM.POR.000001.A.MSR.tiff'), False),
+        (Path('/archive/output_old/1950.06.15.12.00.00.E.FAM.POR.000001.A.MSR.tiff'), True),
+    ])
+    def test_should_process(self, organizer: FileOrganizer, path: Path, expected: bool) -> None:
         """
         Test that should_process checks extension and path filters.
         """
-        organizer = FileOrganizer(logger)
-        output = Path('/archive/output')
-        # Valid extension
-        assert organizer.should_process(Path('1950.06.15.12.00.00.E.FAM.POR.000001.A.MSR.tiff'), output_path=output) is True
-        assert organizer.should_process(Path('invalid.jpg'), output_path=output) is True  # .jpg is supported extension
-        # Invalid extension
-        assert organizer.should_process(Path('file.txt'), output_path=output) is False
-
-    def test_rejects_same_input_output(self, logger: Logger, tmp_path: Path) -> None:
+        assert organizer.should_process(path, output_path=Path('/archive/output')) is expected
+
+    def test_rejects_same_input_output(self, organizer: FileOrganizer, tmp_path: Path) -> None:
         """Output equal to input must raise ValueError."""
-        organizer = FileOrganizer(logger)
         with pytest.raises(ValueError, match="must not overlap"):
             organizer(input_path=tmp_path, output_path=tmp_path)
 
-    def test_rejects_output_inside_input(self, logger: Logger, tmp_path: Path) -> None:
+    def test_rejects_output_inside_input(self, organizer: FileOrganizer, tmp_path: Path) -> None:
         """Output that is a subdirectory of input must raise ValueError."""
-        organizer = FileOrganizer(logger)
         nested = tmp_path / "sub" / "deep"
         nested.mkdir(parents=True)
         with pytest.raises(ValueError, match="inside input path"):
             organizer(input_path=tmp_path, output_path=nested)
 
-    def test_rejects_input_inside_output(self, logger: Logger, tmp_path: Path) -> None:
+    def test_rejects_input_inside_output(self, organizer: FileOrganizer, tmp_path: Path) -> None:
         """Input that is a subdirectory of output must raise ValueError."""
-        organizer = FileOrganizer(logger)
         parent = tmp_path / "archive"
         child = parent / "inbox"
         parent.mkdir()
@@ -76,166 +284,150 @@ class TestFileOrganizer:
             organizer(input_path=child, output_path=parent)
 
 
-class TestFileOrganizerIntegration:
+class _TempDirs:
     """
-    Integration tests for FileOrganizer with filesystem operations.
+    Per-test input/output directories rooted under pytest's tmp_path.
     """
 
-    def setup_method(self) -> None:
+    @pytest.fixture(autouse=True)
+    def _temp_root(self, tmp_path: Path) -> None:
         """
-        Setup for each test method.
+        Root each test's directories under pytest's tmp_path.
         """
-        self.temp_dir: Path | None = None
-        ProjectConfig.instance(data=DEFAULT_CONFIG)
+        self.temp_dir = tmp_path
 
-    def teardown_method(self) -> None:
-        """
-        Cleanup after each test method.
+    def create_temp_dir(self, name: str = "") -> tuple[Path, Path]:
         """
-        if self.temp_dir and self.temp_dir.exists():
-            _rmtree_force(self.temp_dir)
+        Create sibling input/ and output/ subdirs under the test's tmp_path.
 
-    def create_temp_dir(self) -> tuple[Path, Path]:
-        """
-        Create a temporary root with sibling input/ and output/ subdirs.
+        Args:
+            name: Optional subdirectory to separate several runs in one test.
 
         Returns:
             (input_dir, output_dir) as sibling directories.
         """
-        root = Path(tempfile.mkdtemp())
-        self.temp_dir = root
+        root = self.temp_dir / name
         input_dir = root / "input"
-        input_dir.mkdir()
+        input_dir.mkdir(parents=True)
         output_dir = root / "output"
         return input_dir, output_dir
 
-    def get_exiftool_json(self, file_path: Path) -> dict[str, Any]:
-        """
-        Helper to read metadata using exiftool.
-        """
-        cmd = ["exiftool", "-json", "-G", str(file_path)]
-        # Force UTF-8 encoding to avoid Windows charmap errors
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True, encoding='utf-8')
-        return json.loads(result.stdout)[0]  # type: ignore[no-any-return]
 
-    def _minimal_config(self) -> dict[str, Any]:
-        """
-        Return minimal organizer config with required metadata languages.
-        """
-        return {
-            "metadata": {
-                "languages": {
-                    "en-US": {
-                        "default": True,
-                        "creator": "Test Author",
-                        "credit": "Test Archive",
-                        "rights": "Test Rights",
-                        "terms": "Test Terms",
-                        "source": "Test Source",
-                        "description": "Test description",
-                    }
-                }
-            }
-        }
+class TestFileOrganizerIntegration(_TempDirs):
+    """
+    Integration tests for FileOrganizer with filesystem operations.
+    """
 
-    def _write_config(self, dir_path: Path, config: dict[str, Any] | None) -> Path | None:
+    def setup_method(self) -> None:
         """
-        Helper: write config dict to dir_path/config.json and return its path.
+        Setup for each test method.
         """
-        if config is None:
-            return None
-        cfg_path = dir_path / "config.json"
-        cfg_path.write_text(json.dumps(config), encoding="utf-8")
-        return cfg_path
+        ProjectConfig.instance(data=DEFAULT_CONFIG)
 
     @staticmethod
     def _norm(v: object) -> str:
         """Normalize a tag value for comparison: lowercase, strip uuid: prefix and dashes."""
         if not isinstance(v, str):
             return str(v)
-        return v.lower().replace('uuid:', '').replace('-', '')
+        return _UUID_NOISE.sub('', v.lower())
 
-    def test_process_valid_tiff(self, logger: Logger) -> None:
+    def test_failed_metadata_write_keeps_source(self, organizer: FileOrganizer, minimal_config_path: Path) -> None:
         """
-        Test processing valid TIFF file.
+        A move-mode source stays untouched in the input folder when metadata fails.
         """
         input_dir, output_dir = self.create_temp_dir()
-        
-        # 1. Setup
+
         filename = "1950.06.15.12.30.45.E.FAM.POR.0001.A.MSR.tiff"
         file_path = input_dir / filename
-        create_test_image(file_path)
-        
-        organizer = FileOrganizer(logger)
+        create_test_image(file_path, metadata_profile="minimal")
+        original = file_path.read_bytes()
 
-        # 2. Execute via batch API
-        config_path = self._write_config(input_dir, self._minimal_config())
-        result = organizer(
-            input_path=input_dir,
-            output_path=output_dir,
-            config_path=config_path,
-            recursive=False,
-            copy_mode=False
-        )
+        with patch.object(FileProcessor, "process", side_effect=RuntimeError("boom")):
+            result = organizer(
+                input_path=input_dir,
+                output_path=output_dir,
+                config_path=minimal_config_path,
+                recursive=False,
+                copy_mode=False
+            )
 
-        # 3. Verify
-        assert result["succeeded"] == 1
-        
-        # Check file moved to output/YYYY/YYYY.MM.DD/SOURCES/
-        # 1950 / 1950.06.15 / SOURCES
-        expected_path = output_dir / "1950" / "1950.06.15" / "SOURCES" / filename
-        
-        assert expected_path.exists()
-        assert not file_path.exists() # Original should be gone
-        
-        # Check Metadata
-        meta = self.get_exiftool_json(expected_path)
-        
-        # Check XMP Identifier
-        assert "XMP:Identifier" in meta or "XMP-dc:Identifier" in meta or "XMP-xmp:Identifier" in meta
-        
-        # Check Date (Exact date E)
-        assert "ExifIFD:DateTimeOriginal" in meta or "EXIF:DateTimeOriginal" in meta
-        dt_orig = meta.get("ExifIFD:DateTimeOriginal") or meta.get("EXIF:DateTimeOriginal")
-        assert dt_orig == "1950:06:15 12:30:45"
-        
-        assert "XMP:DateCreated" in meta or "XMP-photoshop:DateCreated" in meta
-        date_created = meta.get("XMP:DateCreated") or meta.get("XMP-photoshop:DateCreated")
-        assert date_created == "1950:06:15 12:30:45" or date_created == "1950-06-15T12:30:45"
+        assert result["failed"] == 1
+        assert file_path.read_bytes() == original
+        assert not list(output_dir.rglob(f"{filename}*"))
 
-    def test_process_normalization(self, logger: Logger) -> None:
+    def test_failed_final_rename_keeps_source(self, organizer: FileOrganizer, minimal_config_path: Path) -> None:
         """
-        Test that filename is normalized (sequence 1 -> 0001).
+        A failed rename into the archive leaves the source as it was and no temp file.
         """
         input_dir, output_dir = self.create_temp_dir()
-        
-        # Input: 1 digit sequence
-        filename = "1950.06.15.12.30.45.E.FAM.POR.1.A.MSR.tiff"
-        expected_filename = "1950.06.15.12.30.45.E.FAM.POR.0001.A.MSR.tiff"
-        
+
+        filename = "1950.06.15.12.30.45.E.FAM.POR.0001.A.MSR.tiff"
         file_path = input_dir / filename
-        create_test_image(file_path)
-        
-        organizer = FileOrganizer(logger)
+        create_test_image(file_path, metadata_profile="minimal")
+        original = file_path.read_bytes()
+
+        with patch.object(Path, "rename", side_effect=OSError("rename failed")):
+            result = organizer(
+                input_path=input_dir,
+                output_path=output_dir,
+                config_path=minimal_config_path,
+                recursive=False,
+                copy_mode=False
+            )
+
+        assert result["failed"] == 1
+        assert file_path.read_bytes() == original
+        assert not list(output_dir.rglob(f"{filename}*"))
+
+    @pytest.mark.parametrize("filename,expected_rel_path,absent_subdirs", [
+        # Filename is normalized (sequence 1 -> 0001)
+        (
+            "1950.06.15.12.30.45.E.FAM.POR.1.A.MSR.tiff",
+            "1950/1950.06.15/SOURCES/1950.06.15.12.30.45.E.FAM.POR.0001.A.MSR.tiff",
+            (),
+        ),
+        # PRV preview files go directly in the date folder root
+        (
+            "1950.06.15.12.30.45.E.FAM.POR.0003.A.PRV.jpg",
+            "1950/1950.06.15/1950.06.15.12.30.45.E.FAM.POR.0003.A.PRV.jpg",
+            ("SOURCES", "DERIVATIVES"),
+        ),
+    ], ids=["normalized_sequence", "preview_in_date_root"])
+    def test_process_placement(
+        self,
+        organizer: FileOrganizer,
+        minimal_config_path: Path,
+        filename: str,
+        expected_rel_path: str,
+        absent_subdirs: tuple[str, ...],
+    ) -> None:
+        """
+        Test that a processed file lands at its expected archive path.
+        """
+        input_dir, output_dir = self.create_temp_dir()
+
+        file_path = input_dir / filename
+        create_test_image(file_path, metadata_profile="minimal")
 
-        # Execute
-        config_path = self._write_config(input_dir, self._minimal_config())
         processed_count = organizer(
-            input_path=input_dir, 
+            input_path=input_dir,
             output_path=output_dir,
-            config_path=config_path, 
-            recursive=False, 
+            config_path=minimal_config_path,
+            recursive=False,
             copy_mode=False
         )
-        
         assert processed_count["succeeded"] == 1
-        
-        # Verify normalized filename in output folder
-        # 1950 / 1950.06.15 / SOURCES
-        expected_path = output_dir / "1950" / "1950.06.15" / "SOURCES" / expected_filename
-        assert expected_path.exists()
 
-    def test_process_circa_date(self, logger: Logger) -> None:
+        expected_path = output_dir / expected_rel_path
+        with os.scandir(expected_path.parent) as entries:
+            names = {entry.name for entry in entries}
+
+        assert expected_path.name in names
+        assert not file_path.exists()
+        for subdir in absent_subdirs:
+            assert subdir not in names
+
+    def test_process_circa_date(self, organizer: FileOrganizer, minimal_config_path: Path) -> None:
         """
         Test processing of Circa date (no time in EXIF).
         """
@@ -243,15 +435,12 @@ class TestFileOrganizerIntegration:
         
         filename = "1950.00.00.00.00.00.C.FAM.POR.0002.A.WEB.jpg"
         file_path = input_dir / filename
-        create_test_image(file_path)
+        create_test_image(file_path, metadata_profile="full")
         
-        organizer = FileOrganizer(logger)
-
-        config_path = self._write_config(input_dir, self._minimal_config())
         processed_count = organizer(
             input_path=input_dir, 
             output_path=output_dir,
-            config_path=config_path, 
+            config_path=minimal_config_path, 
             recursive=False, 
             copy_mode=False
         )
@@ -259,319 +448,150 @@ class TestFileOrganizerIntegration:
         
         # 1950 / 1950.00.00 / DERIVATIVES
         expected_path = output_dir / "1950" / "1950.00.00" / "DERIVATIVES" / filename
-        assert expected_path.exists()
         
-        meta = self.get_exiftool_json(expected_path)
+        meta = read_exiftool_json(expected_path, ["DateTimeOriginal", "DateCreated"])
         
         # Should NOT have DateTimeOriginal for Circa dates
-        assert "ExifIFD:DateTimeOriginal" not in meta and "EXIF:DateTimeOriginal" not in meta
+        assert first_present(meta, *_DATE_TIME_ORIGINAL_KEYS) is None
         
         # Should have partial date in XMP
-        assert "XMP:DateCreated" in meta or "XMP-photoshop:DateCreated" in meta
-        date_created = meta.get("XMP:DateCreated") or meta.get("XMP-photoshop:DateCreated")
+        date_created = first_present(meta, *_DATE_CREATED_KEYS)
         assert str(date_created) == "1950"
 
-    def test_process_preview_file_placed_in_date_root(self, logger: Logger) -> None:
-        """
-        PRV preview files should be placed directly in the date folder root.
-        """
-        input_dir, output_dir = self.create_temp_dir()
-
-        # Exact date preview (PRV) file
-        filename = "1950.06.15.12.30.45.E.FAM.POR.0003.A.PRV.jpg"
-        file_path = input_dir / filename
-        create_test_image(file_path)
-
-        organizer = FileOrganizer(logger)
-
-        # Execute
-        config_path = self._write_config(input_dir, self._minimal_config())
-        processed_count = organizer(
-            input_path=input_dir, 
-            output_path=output_dir,
-            config_path=config_path, 
-            recursive=False, 
-            copy_mode=False
-        )
-        assert processed_count["succeeded"] == 1
-
-        # PRV should be stored in output/YYYY/YYYY.MM.DD/ (no SOURCES/DERIVATIVES)
-        expected_dir = output_dir / "1950" / "1950.06.15"
-        expected_path = expected_dir / filename
-
-        assert expected_path.exists()
-        assert not file_path.exists()
-
-        # Sanity check: no SOURCES/ or DERIVATIVES/ subfolder created for this PRV file
-        assert not (expected_dir / "SOURCES").exists()
-        assert not (expected_dir / "DERIVATIVES").exists()
-
-    def test_protected_files_are_read_only(self, logger: Logger) -> None:
+    def test_protected_files_are_read_only(self, organizer: FileOrganizer, minimal_config_path: Path) -> None:
         """Files matched by a routing rule with protect=true should be read-only."""
-        import stat
-
         input_dir, output_dir = self.create_temp_dir()
 
         # MSR → SOURCES with protect=true (default routes)
         filename = "1950.06.15.12.30.45.E.FAM.POR.0001.A.MSR.tiff"
         file_path = input_dir / filename
-        create_test_image(file_path)
+        create_test_image(file_path, metadata_profile="minimal")
 
-        organizer = FileOrganizer(logger)
-        config_path = self._write_config(input_dir, self._minimal_config())
         processed_count = organizer(
             input_path=input_dir,
             output_path=output_dir,
-            config_path=config_path,
+            config_path=minimal_config_path,
             recursive=False,
             copy_mode=False,
         )
         assert processed_count["succeeded"] == 1
 
         dest = output_dir / "1950" / "1950.06.15" / "SOURCES" / filename
-        assert dest.exists()
 
         mode = dest.stat().st_mode
         assert not (mode & stat.S_IWUSR), "Owner write bit should be cleared"
         assert not (mode & stat.S_IWGRP), "Group write bit should be cleared"
         assert not (mode & stat.S_IWOTH), "Other write bit should be cleared"
 
-    def test_unprotected_files_stay_writable(self, logger: Logger) -> None:
+    def test_unprotected_files_stay_writable(self, organizer: FileOrganizer, minimal_config_path: Path) -> None:
         """Files matched by a rule without protect flag should remain writable."""
-        import stat
-
         input_dir, output_dir = self.create_temp_dir()
 
         # WEB → DERIVATIVES, no protect flag (default routes)
         filename = "1950.06.15.12.30.45.E.FAM.POR.0001.A.WEB.jpg"
         file_path = input_dir / filename
-        create_test_image(file_path)
+        create_test_image(file_path, metadata_profile="minimal")
 
-        organizer = FileOrganizer(logger)
-        config_path = self._write_config(input_dir, self._minimal_config())
         processed_count = organizer(
             input_path=input_dir,
             output_path=output_dir,
-            config_path=config_path,
+            config_path=minimal_config_path,
             recursive=False,
             copy_mode=False,
         )
         assert processed_count["succeeded"] == 1
 
         dest = output_dir / "1950" / "1950.06.15" / "DERIVATIVES" / filename
-        assert dest.exists()
 
         mode = dest.stat().st_mode
         assert mode & stat.S_IWUSR, "Owner write bit should still be set"
 
-    def test_date_modifier_scenarios(self, logger: Logger, require_exiftool: None) -> None:
-        """Test FileOrganizer with different date modifiers (E, C, B, F, A).
+    def test_tagged_base_image_identifiers(self, exifer: Exifer, tagged_base_image: tuple[Path, str, str, str]) -> None:
+        """Identifiers, CreatorTool and XMP History written for the date-modifier scenarios read back intact."""
+        base_path, instance, document, creator = tagged_base_image
+
+        # Read back tags including history
+        read_back = exifer.read(base_path, [TAG_XMP_XMPMM_INSTANCE_ID, TAG_XMP_XMPMM_DOCUMENT_ID, TAG_XMP_XMP_CREATOR_TOOL, TAG_XMP_XMPMM_HISTORY])
+
+        # Verify identifiers and CreatorTool
+        assert self._norm(read_back.get(TAG_XMP_XMPMM_INSTANCE_ID, '')) == instance, "InstanceID not written correctly"
+        assert self._norm(read_back.get(TAG_XMP_XMPMM_DOCUMENT_ID, '')) == document, "DocumentID not written correctly"
+        assert read_back.get(TAG_XMP_XMP_CREATOR_TOOL) == creator, "CreatorTool not written correctly"
+
+        # Verify history if present
+        history_raw = read_back.get(TAG_XMP_XMPMM_HISTORY)
+        if history_raw:
+            history_text = str(history_raw).lower()
+            assert XMP_ACTION_CREATED in history_text, "Missing 'created' action in history"
+            assert XMP_ACTION_EDITED in history_text, "Missing 'edited' action in history"
+            assert instance in history_text, "Missing instance ID in history"
+
+    @pytest.mark.parametrize("scenario", _DATE_MODIFIER_SCENARIOS, ids=lambda scenario: scenario["name"])
+    def test_date_modifier_scenario(self, organizer: FileOrganizer, tagged_base_image: tuple[Path, str, str, str], date_modifier_config_path: Path, scenario: Mapping[str, str]) -> None:
+        """Test FileOrganizer with each date modifier (E, C, B, F, A).
         
-        This test validates that files with various date precision levels
-        are correctly processed and placed in appropriate year folders.
-        Also verifies XMP History tracking works across different scenarios.
-        """
-        scenarios: list[dict[str, str]] = [
-            {
-                "name": "Exact Date",
-                "filename": "2023.10.27.12.00.00.E.Group.Sub.0001.A.Orig.jpg",
-                "folder_l1": "2023",
-            },
-            {
-                "name": "Circa Year",
-                "filename": "1950.00.00.00.00.00.C.Group.Sub.0002.A.Orig.jpg",
-                "folder_l1": "1950",
-            },
-            {
-                "name": "Before Year-Month",
-                "filename": "1960.01.00.00.00.00.B.Group.Sub.0003.A.Orig.jpg",
-                "folder_l1": "1960",
-            },
-            {
-                "name": "After Year-Month-Day",
-                "filename": "1970.05.20.00.00.00.F.Group.Sub.0004.A.Orig.jpg",
-                "folder_l1": "1970",
-            },
-            {
-                "name": "Absent Date",
-                "filename": "0000.00.00.00.00.00.A.Group.Sub.0005.A.Orig.jpg",
-                "folder_l1": "0000",
-            },
-        ]
+        This test validates that a file with the scenario's date precision
+        is correctly processed and placed in the appropriate year folder.
+        """
+        input_dir, output_dir = self.create_temp_dir()
+        filename = scenario["filename"]
+        file_path = input_dir / filename
         
-        for scenario in scenarios:
-            input_dir, output_dir = self.create_temp_dir()
-            filename = scenario["filename"]
-            file_path = input_dir / filename
-            
-            # Create test image
-            create_test_image(file_path)
-            
-            # Write XMP identifiers and history entries
-            ex = Exifer()
-            
-            # Check existing tags and only write missing ones
-            existing = ex.read(file_path, [TAG_XMP_XMPMM_INSTANCE_ID, TAG_XMP_XMPMM_DOCUMENT_ID, TAG_XMP_XMP_CREATOR_TOOL])
-            
-            instance: str | None = existing.get(TAG_XMP_XMPMM_INSTANCE_ID)
-            document: str | None = existing.get(TAG_XMP_XMPMM_DOCUMENT_ID)
-            creator: str | None = existing.get(TAG_XMP_XMP_CREATOR_TOOL)
-            
-            to_write: dict[str, str] = {}
-            if not instance:
-                instance = uuid.uuid4().hex
-                to_write[TAG_XMP_XMPMM_INSTANCE_ID] = instance
-            if not document:
-                document = uuid.uuid4().hex
-                to_write[TAG_XMP_XMPMM_DOCUMENT_ID] = document
-            if not creator:
-                creator = "test-organizer"
-                to_write[TAG_XMP_XMP_CREATOR_TOOL] = creator
-            
-            if to_write:
-                ex.write(file_path, to_write)
-            
-            # Append history entries via Tagger
-            created_when = datetime.fromtimestamp(file_path.stat().st_mtime, tz=timezone.utc)
-            tagger = Tagger(file_path, exifer=ex)
-            tagger.begin()
-            tagger.write(HistoryTag(
-                action=XMP_ACTION_CREATED,
-                when=created_when,
-                software_agent="test-organizer",
-                instance_id=instance,
-            ))
-            tagger.write(HistoryTag(
-                action=XMP_ACTION_EDITED,
-                when=datetime.now(timezone.utc),
-                software_agent="test-organizer",
-                changed="metadata",
-                instance_id=instance,
-            ))
-            tagger.end()
-            
-            # Read back tags including history
-            read_back = ex.read(file_path, [TAG_XMP_XMPMM_INSTANCE_ID, TAG_XMP_XMPMM_DOCUMENT_ID, TAG_XMP_XMP_CREATOR_TOOL, TAG_XMP_XMPMM_HISTORY])
-
-            # Verify identifiers and CreatorTool
-            assert instance is not None
-            assert document is not None
-            assert self._norm(read_back.get(TAG_XMP_XMPMM_INSTANCE_ID, '')) == instance, f"{scenario['name']}: InstanceID not written correctly"
-            assert self._norm(read_back.get(TAG_XMP_XMPMM_DOCUMENT_ID, '')) == document, f"{scenario['name']}: DocumentID not written correctly"
-            assert read_back.get(TAG_XMP_XMP_CREATOR_TOOL) == creator, f"{scenario['name']}: CreatorTool not written correctly"
-            
-            # Verify history if present
-            history_raw = read_back.get(TAG_XMP_XMPMM_HISTORY)
-            if history_raw:
-                history_text = str(history_raw).lower()
-                assert XMP_ACTION_CREATED in history_text, f"{scenario['name']}: Missing 'created' action in history"
-                assert XMP_ACTION_EDITED in history_text, f"{scenario['name']}: Missing 'edited' action in history"
-                assert instance is not None
-                assert instance in history_text, f"{scenario['name']}: Missing instance ID in history"
-            
-            # Process with FileOrganizer
-            organizer = FileOrganizer(logger)
-            config: dict[str, Any] = {
-                "metadata": {
-                    "languages": {
-                        "en-US": {
-                            "default": True,
-                            "creator": "Test User",
-                            "rights": "Public Domain",
-                        }
-                    }
-                }
-            }
-            
-            config_path = input_dir / "config.json"
-            config_path.write_text(json.dumps(config), encoding="utf-8")
-            
-            processed_count = organizer(
-                input_path=input_dir,
-                output_path=output_dir,
-                config_path=config_path,
-                recursive=False,
-                copy_mode=False,
-            )
-            
-            assert processed_count["succeeded"] == 1, f"{scenario['name']}: FileOrganizer failed to process file"
-            
-            # Verify file moved into output/YYYY/... tree
-            found_files = list(output_dir.rglob(filename))
-            assert len(found_files) == 1, f"{scenario['name']}: File not found in output folder"
-            processed_path = found_files[0]
-            
-            # Level 1 folder should match expected year
-            l1_folder = processed_path.parent.parent.parent.name
-            assert l1_folder == scenario["folder_l1"], f"{scenario['name']}: Expected folder {scenario['folder_l1']}, got {l1_folder}"
-            
-            # Cleanup for next scenario
-            assert self.temp_dir is not None
-            _rmtree_force(self.temp_dir)
-            self.temp_dir = None
-
-
-class TestFileOrganizerCustomFormats:
+        # Every scenario starts from the same tagged image
+        shutil.copyfile(tagged_base_image[0], file_path)
+        
+        # Process with FileOrganizer
+        processed_count = organizer(
+            input_path=input_dir,
+            output_path=output_dir,
+            config_path=date_modifier_config_path,
+            recursive=False,
+            copy_mode=False,
+        )
+        
+        assert processed_count["succeeded"] == 1, f"{scenario['name']}: FileOrganizer failed to process file"
+        
+        # Verify file moved into output/YYYY/YYYY.MM.DD/DERIVATIVES/
+        processed_path = output_dir / scenario["expected_subpath"] / filename
+        assert processed_path.exists(), f"{scenario['name']}: File not found at {processed_path}"
+
+
+class TestFileOrganizerCustomFormats(_TempDirs):
     """
     Test FileOrganizer with custom path and filename formats.
     """
     
-    def setup_method(self) -> None:
-        """
-        Setup for each test method.
-        """
-        self.temp_dir: Path | None = None
-
     def teardown_method(self) -> None:
         """
         Cleanup after each test method.
         """
         ProjectConfig.instance(data=DEFAULT_CONFIG)
-        if self.temp_dir and self.temp_dir.exists():
-            _rmtree_force(self.temp_dir)
-    
-    def create_temp_dir(self) -> tuple[Path, Path]:
+
+    def _organize(self, logger: Logger, source_image: Path, filename: str, config_path: Path) -> Path:
         """
-        Create a temporary root with sibling input/ and output/ subdirs.
+        Copy the shared tagged image in as *filename* and organize it.
+
+        A fresh FileOrganizer is built so its Router picks up the formats
+        the test installed in ProjectConfig.
+
+        Returns:
+            The output directory of the run.
         """
-        root = Path(tempfile.mkdtemp())
-        self.temp_dir = root
-        input_dir = root / "input"
-        input_dir.mkdir()
-        output_dir = root / "output"
-        return input_dir, output_dir
-    
-    def _write_config(self, dir_path: Path, config: dict[str, Any] | None) -> Path | None:
-        """
-        Helper: write config dict to dir_path/config.json and return its path.
-        """
-        if config is None:
-            return None
-        cfg_path = dir_path / "config.json"
-        cfg_path.write_text(json.dumps(config), encoding="utf-8")
-        return cfg_path
-
-    def _minimal_config(self) -> dict[str, Any]:
-        """
-        Minimal configuration for testing.
-        """
-        return {
-            "metadata": {
-                "languages": {
-                    "en-US": {
-                        "default": True,
-                        "creator": "Test User",
-                        "credit": "Test Archive",
-                        "rights": "Test Rights",
-                        "terms": "Test Terms",
-                        "source": "Test Source",
-                        "description": "Test description",
-                    }
-                }
-            }
-        }
-    
-    def test_process_with_flat_path_structure(self, logger: Logger) -> None:
+        input_dir, output_dir = self.create_temp_dir()
+        shutil.copyfile(source_image, input_dir / filename)
+
+        organizer = FileOrganizer(logger)
+        processed_count = organizer(
+            input_path=input_dir,
+            output_path=output_dir,
+            config_path=config_path,
+            recursive=False,
+            copy_mode=False,
+        )
+        assert processed_count["succeeded"] == 1
+        return output_dir
+
+    def test_process_with_flat_path_structure(self, logger: Logger, minimal_config_path: Path) -> None:
         """
         Test file organization with flat path structure (no year folder).
         """
@@ -579,7 +599,7 @@ class TestFileOrganizerCustomFormats:
         
         filename = "2024.03.15.14.30.00.E.TEST.GRP.0001.A.RAW.tif"
         file_path = input_dir / filename
-        create_test_image(file_path)
+        create_test_image(file_path, metadata_profile="minimal")
         
         # Re-initialize ProjectConfig with custom formats for this test
         ProjectConfig.instance(data={
@@ -591,13 +611,11 @@ class TestFileOrganizerCustomFormats:
         })
         organizer = FileOrganizer(logger)
         
-        config_path = self._write_config(input_dir, self._minimal_config())
-        
         # Run batch
         processed_count = organizer(
              input_path=input_dir,
              output_path=output_dir,
-             config_path=config_path,
+             config_path=minimal_config_path,
              recursive=False,
              copy_mode=False
         )
@@ -607,16 +625,10 @@ class TestFileOrganizerCustomFormats:
         expected_path = output_dir / "2024.03.15" / "SOURCES" / filename
         assert expected_path.exists(), f"File not found at {expected_path}"
     
-    def test_process_with_month_grouping(self, logger: Logger) -> None:
+    def test_process_with_month_grouping(self, logger: Logger, tagged_base_image: tuple[Path, str, str, str], minimal_config_path: Path) -> None:
         """
         Test file organization grouped by year and month.
         """
-        input_dir, output_dir = self.create_temp_dir()
-        
-        filename = "2024.03.15.14.30.00.E.TEST.GRP.0001.A.MSR.tif"
-        file_path = input_dir / filename
-        create_test_image(file_path)
-        
         ProjectConfig.instance(data={
             **DEFAULT_CONFIG,
             "formats": {
@@ -624,32 +636,17 @@ class TestFileOrganizerCustomFormats:
                 "archive_filename_template": "{year:04d}.{month:02d}.{day:02d}.{hour:02d}.{minute:02d}.{second:02d}.{modifier}.{group}.{subgroup}.{sequence:04d}.{side}.{suffix}",
             },
         })
-        organizer = FileOrganizer(logger)
-        
-        config_path = self._write_config(input_dir, self._minimal_config())
-        processed_count = organizer(
-             input_path=input_dir,
-             output_path=output_dir,
-             config_path=config_path,
-             recursive=False,
-             copy_mode=False
-        )
-        assert processed_count["succeeded"] == 1
-        
+        filename = "2024.03.15.14.30.00.E.TEST.GRP.0001.A.MSR.jpg"
+        output_dir = self._organize(logger, tagged_base_image[0], filename, minimal_config_path)
+
         # File should be in: output/2024/2024.03/SOURCES/
         expected_path = output_dir / "2024" / "2024.03" / "SOURCES" / filename
         assert expected_path.exists(), f"File not found at {expected_path}"
     
-    def test_process_with_group_in_path(self, logger: Logger) -> None:
+    def test_process_with_group_in_path(self, logger: Logger, tagged_base_image: tuple[Path, str, str, str], minimal_config_path: Path) -> None:
         """
         Test file organization with group component in path.
         """
-        input_dir, output_dir = self.create_temp_dir()
-        
-        filename = "2024.03.15.14.30.00.E.FAM.POR.0001.A.RAW.tif"
-        file_path = input_dir / filename
-        create_test_image(file_path)
-        
         ProjectConfig.instance(data={
             **DEFAULT_CONFIG,
             "formats": {
@@ -657,32 +654,17 @@ class TestFileOrganizerCustomFormats:
                 "archive_filename_template": "{year:04d}.{month:02d}.{day:02d}.{hour:02d}.{minute:02d}.{second:02d}.{modifier}.{group}.{subgroup}.{sequence:04d}.{side}.{suffix}",
             },
         })
-        organizer = FileOrganizer(logger)
-        
-        config_path = self._write_config(input_dir, self._minimal_config())
-        processed_count = organizer(
-             input_path=input_dir,
-             output_path=output_dir,
-             config_path=config_path,
-             recursive=False,
-             copy_mode=False
-        )
-        assert processed_count["succeeded"] == 1
-        
+        filename = "2024.03.15.14.30.00.E.FAM.POR.0001.A.RAW.jpg"
+        output_dir = self._organize(logger, tagged_base_image[0], filename, minimal_config_path)
+
         # File should be in: output/FAM/2024/2024.03.15/SOURCES/
         expected_path = output_dir / "FAM" / "2024" / "2024.03.15" / "SOURCES" / filename
         assert expected_path.exists(), f"File not found at {expected_path}"
     
-    def test_process_with_compact_filename(self, logger: Logger) -> None:
+    def test_process_with_compact_filename(self, logger: Logger, tagged_base_image: tuple[Path, str, str, str], minimal_config_path: Path) -> None:
         """
         Test file organization with compact filename format.
         """
-        input_dir, output_dir = self.create_temp_dir()
-        
-        original_filename = "2024.03.15.14.30.00.E.TEST.GRP.0042.A.RAW.tif"
-        file_path = input_dir / original_filename
-        create_test_image(file_path)
-        
         ProjectConfig.instance(data={
             **DEFAULT_CONFIG,
             "formats": {
@@ -690,177 +672,60 @@ class TestFileOrganizerCustomFormats:
                 "archive_filename_template": "{year:04d}{month:02d}{day:02d}_{hour:02d}{minute:02d}{second:02d}_{group}_{suffix}",
             },
         })
-        organizer = FileOrganizer(logger)
-        
-        config_path = self._write_config(input_dir, self._minimal_config())
-        processed_count = organizer(
-             input_path=input_dir,
-             output_path=output_dir,
-             config_path=config_path,
-             recursive=False,
-             copy_mode=False
-        )
-        assert processed_count["succeeded"] == 1
-        
-        # File should have compact name: 20240315_143000_TEST_RAW.tif
-        expected_filename = "20240315_143000_TEST_RAW.tif"
-        expected_path = output_dir / "2024" / "2024.03.15" / "SOURCES" / expected_filename
+        filename = "2024.03.15.14.30.00.E.TEST.GRP.0042.A.RAW.jpg"
+        output_dir = self._organize(logger, tagged_base_image[0], filename, minimal_config_path)
+
+        # File should have compact name: 20240315_143000_TEST_RAW.jpg
+        expected_path = output_dir / "2024" / "2024.03.15" / "SOURCES" / "20240315_143000_TEST_RAW.jpg"
         assert expected_path.exists(), f"File not found at {expected_path}"
 
 
-class TestExiftoolCompliance:
+class TestExiftoolCompliance(_TempDirs):
     """
     Tests for FileOrganizer metadata compliance with exiftool.
     """
 
-    def setup_method(self) -> None:
-        """
-        Setup for each test method.
-        """
-        self.temp_dir: Path | None = None
-
-    def teardown_method(self) -> None:
+    def test_valid_tiff_moved_to_sources(self, processed_tiff: tuple[dict[str, int], Path, Path, dict[str, Any]]) -> None:
         """
-        Cleanup after each test method.
+        An exact-date MSR TIFF is moved into YYYY/YYYY.MM.DD/SOURCES/.
         """
-        if self.temp_dir and self.temp_dir.exists():
-            _rmtree_force(self.temp_dir)
+        result, source_path, processed_path, _ = processed_tiff
+        assert result["succeeded"] == 1
+        assert processed_path.exists()
+        assert not source_path.exists()
 
-    def create_temp_dir(self) -> tuple[Path, Path]:
-        """
-        Create a temporary root with sibling input/ and output/ subdirs.
+    @pytest.mark.parametrize("keys,expected", [
+        (_DATE_TIME_ORIGINAL_KEYS, "1950:06:15 12:30:45"),
+        (("XMP:Credit", "XMP-photoshop:Credit"), "The Archive"),
+        (("XMP:Rights", "XMP-dc:Rights"), "Public Domain"),
+        (("XMP:UsageTerms", "XMP-xmpRights:UsageTerms"), "Free to use"),
+        (("XMP:Source", "XMP-dc:Source"), "Box 42"),
+    ])
+    def test_metadata_fields(self, processed_tiff: tuple[dict[str, int], Path, Path, dict[str, Any]], keys: tuple[str, ...], expected: str) -> None:
         """
-        root = Path(tempfile.mkdtemp())
-        self.temp_dir = root
-        input_dir = root / "input"
-        input_dir.mkdir()
-        output_dir = root / "output"
-        return input_dir, output_dir
+        Configured and date-derived fields are written and visible to exiftool.
 
-    def get_exiftool_json(self, file_path: Path) -> dict[str, Any]:
+        Creator is configured too, but exiftool ignores language variants for
+        it, and Title is no longer written (it just duplicated the filename).
         """
-        Helper to read metadata using exiftool.
-        """
-        cmd = ["exiftool", "-json", "-G", str(file_path)]
-        # Force UTF-8 encoding to avoid Windows charmap errors
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True, encoding='utf-8')
-        return json.loads(result.stdout)[0]  # type: ignore[no-any-return]
+        meta = processed_tiff[3]
+        assert first_present(meta, *keys) == expected
 
-    def _minimal_config(self) -> dict[str, Any]:
+    def test_identifier_date_created_and_description(self, processed_tiff: tuple[dict[str, int], Path, Path, dict[str, Any]]) -> None:
         """
-        Return minimal organizer config with required metadata languages.
+        Identifier, XMP DateCreated and the language description are written.
         """
-        return {
-            "metadata": {
-                "languages": {
-                    "en-US": {
-                        "default": True,
-                        "creator": "John Doe",
-                        "credit": "The Archive",
-                        "rights": "Public Domain",
-                        "terms": "Free to use",
-                        "source": "Box 42",
-                        "description": "Test description for 1950-06-15 image",
-                    }
-                }
-            }
-        }
+        meta = processed_tiff[3]
 
-    def _write_config(self, dir_path: Path, config: dict[str, Any] | None) -> Path | None:
-        """Helper: write config dict to dir_path/config.json and return its path.
+        assert first_present(meta, "XMP:Identifier", "XMP-dc:Identifier", "XMP-xmp:Identifier") is not None
 
-        If config is None, returns None so organizer uses its default config lookup.
-        """
-        if config is None:
-            return None
-        cfg_path = dir_path / "config.json"
-        cfg_path.write_text(json.dumps(config), encoding="utf-8")
-        return cfg_path
+        date_created = first_present(meta, *_DATE_CREATED_KEYS)
+        assert date_created in ("1950:06:15 12:30:45", "1950-06-15T12:30:45")
 
-    def test_full_metadata_compliance(self, logger: Logger) -> None:
-        """
-        Verify that all required metadata fields are written and visible to exiftool.
+        desc = first_present(meta, "XMP:Description", "XMP-dc:Description-en-US", "XMP-dc:Description")
+        assert "Test description for 1950-06-15 image" in str(desc)
 
-        Metadata is read from file-organizer/config.json (the ``metadata`` section),
-        not from ProjectConfig.
-        """
-        metadata_config: dict[str, Any] = {
-            "tags": DEFAULT_METADATA["tags"],
-            "languages": {
-                "en-US": {
-                    "default": True,
-                    "creator": "John Doe",
-                    "credit": "The Archive",
-                    "rights": "Public Domain",
-                    "terms": "Free to use",
-                    "source": "Box 42",
-                    "description": "Test description for 1950-06-15 image",
-                }
-            }
-        }
-
-        input_dir, output_dir = self.create_temp_dir()
-
-        filename = "1950.06.15.12.30.45.E.FAM.POR.0001.A.MSR.tiff"
-        file_path = input_dir / filename
-        create_test_image(file_path)
-
-        organizer = FileOrganizer(logger)
-
-        # Metadata lives in file-organizer config, not in ProjectConfig
-        config: dict[str, Any] = {"metadata": metadata_config}
-        config_path = self._write_config(input_dir, config)
-        
-        try:
-            processed_count = organizer(
-                input_path=input_dir,
-                output_path=output_dir,
-                config_path=config_path,
-                recursive=False,
-                copy_mode=False,
-            )
-            assert processed_count["succeeded"] == 1
-
-            # 1950 / 1950.06.15 / SOURCES
-            processed_path = output_dir / "1950" / "1950.06.15" / "SOURCES" / filename
-            assert processed_path.exists()
-
-            meta = self.get_exiftool_json(processed_path)
-
-            # 1. Check Identifiers
-            assert "XMP:Identifier" in meta or "XMP-dc:Identifier" in meta
-
-            # 2. Check DateTimeOriginal (ExifIFD)
-            assert "ExifIFD:DateTimeOriginal" in meta or "EXIF:DateTimeOriginal" in meta
-            dt_orig = meta.get("ExifIFD:DateTimeOriginal") or meta.get("EXIF:DateTimeOriginal")
-            assert dt_orig == "1950:06:15 12:30:45"
-
-            # 3. Check XMP DateCreated
-            assert "XMP:DateCreated" in meta or "XMP-photoshop:DateCreated" in meta
-            date_created = meta.get("XMP:DateCreated") or meta.get("XMP-photoshop:DateCreated")
-            assert date_created is not None
-            assert "1950:06:15 12:30:45" in date_created or "1950-06-15" in date_created
-
-            # 4. Check Description
-            desc = (
-                meta.get("XMP:Description")
-                or meta.get("XMP-dc:Description-en-US")
-                or meta.get("XMP-dc:Description")
-            )
-            assert desc is not None
-            assert "Test description for 1950-06-15 image" in str(desc)
-
-            # 5. Check Configurable Fields (except Creator which doesn't support LangAlt)
-            # Creator is defined in config but exiftool ignores language variants for it
-            assert meta.get("XMP:Credit") == "The Archive" or meta.get("XMP-photoshop:Credit") == "The Archive"
-            assert meta.get("XMP:Rights") == "Public Domain" or meta.get("XMP-dc:Rights") == "Public Domain"
-            assert meta.get("XMP:UsageTerms") == "Free to use" or meta.get("XMP-xmpRights:UsageTerms") == "Free to use"  
-            assert meta.get("XMP:Source") == "Box 42" or meta.get("XMP-dc:Source") == "Box 42"
-            # Title is no longer written (it just duplicated the filename)
-        finally:
-            pass  # ProjectConfig is not modified in this test
-
-    def test_partial_date_compliance(self, logger: Logger) -> None:
+    def test_partial_date_compliance(self, organizer: FileOrganizer, minimal_config_path: Path) -> None:
         """
         Verify partial date handling with exiftool.
         """
@@ -868,15 +733,12 @@ class TestExiftoolCompliance:
 
         filename = "1950.00.00.00.00.00.C.FAM.POR.0002.A.WEB.jpg"
         file_path = input_dir / filename
-        create_test_image(file_path)
+        create_test_image(file_path, metadata_profile="full")
 
-        organizer = FileOrganizer(logger)
-
-        config_path = self._write_config(input_dir, self._minimal_config())
         processed_count = organizer(
             input_path=input_dir,
             output_path=output_dir,
-            config_path=config_path,
+            config_path=minimal_config_path,
             recursive=False,
             copy_mode=False,
         )
@@ -885,7 +747,7 @@ class TestExiftoolCompliance:
         # 1950 / 1950.00.00 / DERIVATIVES
         processed_path = output_dir / "1950" / "1950.00.00" / "DERIVATIVES" / filename
         
-        meta = self.get_exiftool_json(processed_path)
+        meta = read_exiftool_json(processed_path)
         
         # 1. DateTimeOriginal should be ABSENT
         assert "ExifIFD:DateTimeOriginal" not in meta
@@ -898,7 +760,7 @@ class TestExiftoolCompliance:
                 break
         assert found_date, f"Could not find partial date 1950 in metadata: {meta}"
 
-    def test_datetimedigitized_not_overwritten(self, logger: Logger) -> None:
+    def test_datetimedigitized_not_overwritten(self, organizer: FileOrganizer, minimal_config_path: Path) -> None:
         """
         Verify that existing DateTimeDigitized is not overwritten.
         """
@@ -906,33 +768,27 @@ class TestExiftoolCompliance:
 
         filename = "2025.11.29.14.00.00.C.001.001.0001.A.RAW.tiff"
         file_path = input_dir / filename
-        create_test_image(file_path)
+        create_test_image(file_path, metadata_profile="full")
 
-        # Set both
-        subprocess.run([
-            "exiftool",
-            "-EXIF:CreateDate=2025:11:29 14:00:00",
-            "-XMP-exif:DateTimeDigitized=2025:11:29 13:00:00",
-            "-overwrite_original",
-            str(file_path)
-        ], check=True)
+        # Set both over the scanner metadata
+        Exifer().write(file_path, {
+            "EXIF:CreateDate": "2025:11:29 14:00:00",
+            "XMP-exif:DateTimeDigitized": "2025:11:29 13:00:00",
+        })
 
         # Process
-        organizer = FileOrganizer(logger)
-        config_path = self._write_config(input_dir, self._minimal_config())
         processed_count = organizer(
             input_path=input_dir,
             output_path=output_dir,
-            config_path=config_path,
+            config_path=minimal_config_path,
             recursive=False,
             copy_mode=False,
         )
         assert processed_count["succeeded"] == 1
 
         processed_path = output_dir / "2025" / "2025.11.29" / "SOURCES" / filename
-        assert processed_path.exists()
 
-        meta_after = self.get_exiftool_json(processed_path)
+        meta_after = read_exiftool_json(processed_path, ["DateTimeDigitized"])
 
-        dt_digitized = meta_after.get("XMP-exif:DateTimeDigitized") or meta_after.get("XMP:DateTimeDigitized")       
+        dt_digitized = first_present(meta_after, "XMP-exif:DateTimeDigitized", "XMP:DateTimeDigitized")       
         assert dt_digitized == "2025:11:29 13:00:00"
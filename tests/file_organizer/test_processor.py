@@ -2,8 +2,6 @@
 Tests for FileProcessor class.
 """
 
-import shutil
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -20,24 +18,8 @@ class TestFileProcessor:
         """
         Setup for each test method.
         """
-        self.temp_dir = None
         self.logger = Logger("test_processor", console=True)
 
-    def teardown_method(self):
-        """
-        Cleanup after each test method.
-        """
-        if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-
-    def create_temp_dir(self) -> Path:
-        """
-        Create a temporary directory.
-        """
-        temp_dir = tempfile.mkdtemp()
-        self.temp_dir = Path(temp_dir)
-        return self.temp_dir
-
     def _minimal_config(self) -> dict[str, object]:
         """
         Minimal configuration for testing.
@@ -191,17 +191,19 @@ def generate_files(
 
         # Phase 1: scanner EXIF (VueScan writes these without TZ)
         create_date = file_time.strftime("%Y:%m:%d %H:%M:%S")
-
-        exifer.write(file_path, {
+        scanner_tags = {
             TAG_IFD0_MAKE: scanner_make,
             TAG_IFD0_MODEL: scanner_model,
             TAG_IFD0_SOFTWARE: scanner_software,
             TAG_EXIFIFD_CREATE_DATE: create_date,
-        })
+        }
+
+        # Phase 2: scan-batcher XMP metadata (IDs, DateTimeDigitized with TZ, History).
+        # CreateDate is known here, so localize it directly instead of reading it back.
+        file_datetime = file_time.replace(microsecond=0).astimezone()
+        xmp_tags = workflow.build_xmp_tags(file_path, file_datetime, scanner_tags)
 
-        # Phase 2: scan-batcher XMP metadata (IDs, DateTimeDigitized with TZ, History)
-        file_datetime = workflow.get_digitized_datetime(file_path)
-        workflow.write_xmp_metadata(file_path, file_datetime)
+        exifer.write(file_path, scanner_tags | xmp_tags)
 
         generated.append(file_path)
         print(f"  {file_path.name}")
@@ -1,8 +1,4 @@
 import json
-import os
-import shutil
-import subprocess
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -16,7 +12,7 @@ from common.exifer import Exifer
 from common.constants import DEFAULT_CONFIG
 from preview_maker.classes import MakerSettings
 from preview_maker.constants import PREVIEWS_DIR
-from tests.common.test_utils import create_test_image
+from tests.common.test_utils import create_test_image, create_test_images, first_present, read_exiftool_json_batch
 
 
 def _expected_preview_path(archive_base: Path, src_path: Path, preview_name: str) -> Path:
@@ -43,40 +39,9 @@ class MakerTestDouble(Maker):
 
 
 class TestMakerBatch:
-    def setup_method(self) -> None:
-        """
-        Setup for each test method.
-        """
-        self.temp_dir = None
-
-    def teardown_method(self) -> None:
-        """
-        Cleanup after each test method.
-        """
-        if self.temp_dir and self.temp_dir.exists():
-            def _on_rm_error(_func: object, path: str, _exc_info: object) -> None:
-                os.chmod(path, 0o700)
-                os.unlink(path)
-            shutil.rmtree(self.temp_dir, onerror=_on_rm_error)
-
-    def create_temp_dir(self) -> Path:
-        """
-        Create a temporary directory.
-        """
-        temp_dir = tempfile.mkdtemp()
-        self.temp_dir = Path(temp_dir)
-        return self.temp_dir
-
-    def _get_exiftool_json(self, file_path: Path) -> dict[str, object]:
-        cmd = ["exiftool", "-json", "-G", str(file_path)]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True, encoding='utf-8')
-        return json.loads(result.stdout)[0]
-
-    def test_generate_prv_from_msr_prefers_msr_over_raw(self) -> None:
-        temp_dir = self.create_temp_dir()
-
+    def test_generate_prv_from_msr_prefers_msr_over_raw(self, tmp_path: Path) -> None:
         # Simulate small archive fragment
-        date_dir = temp_dir / "PHOTO_ARCHIVES" / "0001.Family" / "1950" / "1950.06.15"
+        date_dir = tmp_path / "PHOTO_ARCHIVES" / "0001.Family" / "1950" / "1950.06.15"
         sources_dir = date_dir / "SOURCES"
         sources_dir.mkdir(parents=True, exist_ok=True)
 
@@ -86,12 +51,11 @@ class TestMakerBatch:
         raw_path = sources_dir / raw_name
         msr_path = sources_dir / msr_name
 
-        create_test_image(raw_path, color="white", format="TIFF")
-        create_test_image(msr_path, color="white", format="TIFF")
+        create_test_images([raw_path, msr_path], color="white", format="TIFF")
 
         maker = Maker(Logger("test_preview_maker"))
         # Pass the archive base (where the year folders start)
-        archive_base = temp_dir / "PHOTO_ARCHIVES" / "0001.Family"
+        archive_base = tmp_path / "PHOTO_ARCHIVES" / "0001.Family"
         count = maker.execute(path=archive_base, overwrite=False)
         assert count == 1
 
@@ -100,17 +64,14 @@ class TestMakerBatch:
             msr_path,
             "1950.06.15.12.00.00.E.FAM.POR.0001.A.PRV.jpg",
         )
-        assert prv_path.exists()
 
         # Ensure size constraint respected (default max_size=2000)
         with Image.open(prv_path) as img:
             w, h = img.size
             assert max(w, h) <= 2000
 
-    def test_overwrite_flag_regenerates_prv(self) -> None:
-        temp_dir = self.create_temp_dir()
-
-        date_dir = temp_dir / "PHOTO_ARCHIVES" / "0001.Family" / "1950" / "1950.06.15"
+    def test_overwrite_flag_regenerates_prv(self, tmp_path: Path) -> None:
+        date_dir = tmp_path / "PHOTO_ARCHIVES" / "0001.Family" / "1950" / "1950.06.15"
         sources_dir = date_dir / "SOURCES"
         sources_dir.mkdir(parents=True, exist_ok=True)
 
@@ -119,7 +80,7 @@ class TestMakerBatch:
         create_test_image(msr_path, size=(3000, 2000), color="white", format="TIFF")
 
         # Use config with max_size=800 for this test
-        config_dir = temp_dir / "config"
+        config_dir = tmp_path / "config"
         config_dir.mkdir()
         pm_config = config_dir / "config.json"
         pm_config.write_text(json.dumps({"image": {"size": 800, "format": "jpeg", "jpeg": {"quality": 70}}}), encoding="utf-8")
@@ -130,7 +91,7 @@ class TestMakerBatch:
                 local_data={"image": {"size": 800, "format": "jpeg", "jpeg": {"quality": 70}}},
             ),
         )
-        archive_base = temp_dir / "PHOTO_ARCHIVES" / "0001.Family"
+        archive_base = tmp_path / "PHOTO_ARCHIVES" / "0001.Family"
         prv_path = _expected_preview_path(
             archive_base,
             msr_path,
@@ -152,7 +113,7 @@ class TestMakerBatch:
         with Image.open(prv_path) as img:
             assert max(img.size) <= 800
 
-    def test_msr_upgrade_regenerates_prv_from_raw(self, require_exiftool: None) -> None:
+    def test_msr_upgrade_regenerates_prv_from_raw(self, tmp_path: Path, require_exiftool: None) -> None:
         """
         When MSR appears after PRV was already generated from RAW,
         process_single_file should regenerate the PRV from MSR even
@@ -161,9 +122,7 @@ class TestMakerBatch:
         The upgrade is detected by comparing DerivedFromDocumentID in the
         existing PRV against the MSR's DocumentID.
         """
-        temp_dir = self.create_temp_dir()
-
-        date_dir = temp_dir / "PHOTO_ARCHIVES" / "0001.Family" / "1952" / "1952.01.10"
+        date_dir = tmp_path / "PHOTO_ARCHIVES" / "0001.Family" / "1952" / "1952.01.10"
         sources_dir = date_dir / "SOURCES"
         sources_dir.mkdir(parents=True, exist_ok=True)
 
@@ -173,7 +132,7 @@ class TestMakerBatch:
 
         logger = Logger("test_msr_upgrade")
         maker = MakerTestDouble(logger)
-        archive_base = temp_dir / "PHOTO_ARCHIVES" / "0001.Family"
+        archive_base = tmp_path / "PHOTO_ARCHIVES" / "0001.Family"
 
         # Step 1: generate PRV from RAW
         result = maker.process_single_file_for_test(
@@ -219,14 +178,12 @@ class TestMakerBatch:
         prv_meta_after = exifer.read(prv_path, [TAG_XMP_XMPMM_DERIVED_FROM_DOCUMENT_ID])
         assert prv_meta_after[TAG_XMP_XMPMM_DERIVED_FROM_DOCUMENT_ID] == msr_doc_id
 
-    def test_msr_no_upgrade_when_prv_already_from_msr(self, require_exiftool: None) -> None:
+    def test_msr_no_upgrade_when_prv_already_from_msr(self, tmp_path: Path, require_exiftool: None) -> None:
         """
         When PRV was already generated from MSR, presenting the same MSR
         again should NOT regenerate (DerivedFromDocumentID already matches).
         """
-        temp_dir = self.create_temp_dir()
-
-        date_dir = temp_dir / "PHOTO_ARCHIVES" / "0001.Family" / "1953" / "1953.05.20"
+        date_dir = tmp_path / "PHOTO_ARCHIVES" / "0001.Family" / "1953" / "1953.05.20"
         sources_dir = date_dir / "SOURCES"
         sources_dir.mkdir(parents=True, exist_ok=True)
 
@@ -236,7 +193,7 @@ class TestMakerBatch:
 
         logger = Logger("test_msr_no_upgrade")
         maker = MakerTestDouble(logger)
-        archive_base = temp_dir / "PHOTO_ARCHIVES" / "0001.Family"
+        archive_base = tmp_path / "PHOTO_ARCHIVES" / "0001.Family"
 
         # Generate PRV from MSR
         result = maker.process_single_file_for_test(
@@ -261,13 +218,11 @@ class TestMakerBatch:
         )
         assert result is False, "Should skip when PRV already derived from same MSR"
 
-    def test_generate_prv_from_raw_when_no_msr(self) -> None:
+    def test_generate_prv_from_raw_when_no_msr(self, tmp_path: Path) -> None:
         """
         If only RAW exists, it should still generate a PRV.
         """
-        temp_dir = self.create_temp_dir()
-
-        date_dir = temp_dir / "PHOTO_ARCHIVES" / "0001.Family" / "1951" / "1951.07.20"
+        date_dir = tmp_path / "PHOTO_ARCHIVES" / "0001.Family" / "1951" / "1951.07.20"
         sources_dir = date_dir / "SOURCES"
         sources_dir.mkdir(parents=True, exist_ok=True)
 
@@ -276,7 +231,7 @@ class TestMakerBatch:
         create_test_image(raw_path, size=(3000, 2000), color="white", format="TIFF")
 
         # Use config with max_size=900 for this test
-        config_dir = temp_dir / "config"
+        config_dir = tmp_path / "config"
         config_dir.mkdir()
         pm_config = config_dir / "config.json"
         pm_config.write_text(json.dumps({"image": {"size": 900, "format": "jpeg", "jpeg": {"quality": 70}}}), encoding="utf-8")
@@ -287,7 +242,7 @@ class TestMakerBatch:
                 local_data={"image": {"size": 900, "format": "jpeg", "jpeg": {"quality": 70}}},
             ),
         )
-        archive_base = temp_dir / "PHOTO_ARCHIVES" / "0001.Family"
+        archive_base = tmp_path / "PHOTO_ARCHIVES" / "0001.Family"
         count = maker.execute(path=archive_base, overwrite=False)
         assert count == 1
 
@@ -296,13 +251,12 @@ class TestMakerBatch:
             raw_path,
             "1951.07.20.13.30.00.E.FAM.POR.0002.A.PRV.jpg",
         )
-        assert prv_path.exists()
 
         with Image.open(prv_path) as img:
             w, h = img.size
             assert max(w, h) <= 900
 
-    def test_prv_inherits_metadata_with_new_identifier(self, require_exiftool: None) -> None:
+    def test_prv_inherits_metadata_with_new_identifier(self, tmp_path: Path, require_exiftool: None) -> None:
         """
         PRV should inherit context metadata but have its own identifier.
 
@@ -311,11 +265,9 @@ class TestMakerBatch:
         preserved while identifiers differ and a relation back to the master
         is recorded.
         """
-        temp_dir = self.create_temp_dir()
-
-        input_dir = temp_dir / "input"
+        input_dir = tmp_path / "input"
         input_dir.mkdir(parents=True, exist_ok=True)
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         filename = "1950.06.15.12.30.45.E.FAM.POR.0001.A.MSR.tiff"
         msr_path = input_dir / filename
@@ -356,18 +308,6 @@ class TestMakerBatch:
         processed_msr = output_dir / "1950" / "1950.06.15" / "SOURCES" / filename
         assert processed_msr.exists()
 
-        meta_master = self._get_exiftool_json(processed_msr)
-
-        master_id = meta_master.get(TAG_XMP_XMP_IDENTIFIER) or meta_master.get(TAG_XMP_DC_IDENTIFIER) or meta_master.get("XMP:Identifier")
-        assert master_id
-
-        master_desc = meta_master.get(TAG_XMP_DC_DESCRIPTION) or meta_master.get("XMP:Description")
-        master_creator = meta_master.get(TAG_XMP_DC_CREATOR) or meta_master.get("XMP:Creator")
-        master_rights = meta_master.get(TAG_XMP_DC_RIGHTS) or meta_master.get("XMP:Rights")
-        master_credit = meta_master.get(TAG_XMP_PHOTOSHOP_CREDIT) or meta_master.get("XMP:Credit")
-        master_usage = meta_master.get(TAG_XMP_XMPRIGHTS_USAGE_TERMS) or meta_master.get("XMP:UsageTerms")
-        master_source = meta_master.get(TAG_XMP_DC_SOURCE) or meta_master.get("XMP:Source")
-
         # Step 2: generate PRV via Maker
         maker = Maker(logger)
         # Pass the archive base where year folders begin
@@ -382,21 +322,32 @@ class TestMakerBatch:
         )
         assert prv_path.exists()
 
-        meta_prv = self._get_exiftool_json(prv_path)
+        # Maker only writes to the PRV, so both files are read in one call
+        meta_master, meta_prv = read_exiftool_json_batch([processed_msr, prv_path])
 
-        prv_id = meta_prv.get(TAG_XMP_XMP_IDENTIFIER) or meta_prv.get(TAG_XMP_DC_IDENTIFIER) or meta_prv.get("XMP:Identifier")
+        master_id = first_present(meta_master, TAG_XMP_XMP_IDENTIFIER, TAG_XMP_DC_IDENTIFIER, "XMP:Identifier")
+        assert master_id
+
+        master_desc = first_present(meta_master, TAG_XMP_DC_DESCRIPTION, "XMP:Description")
+        master_creator = first_present(meta_master, TAG_XMP_DC_CREATOR, "XMP:Creator")
+        master_rights = first_present(meta_master, TAG_XMP_DC_RIGHTS, "XMP:Rights")
+        master_credit = first_present(meta_master, TAG_XMP_PHOTOSHOP_CREDIT, "XMP:Credit")
+        master_usage = first_present(meta_master, TAG_XMP_XMPRIGHTS_USAGE_TERMS, "XMP:UsageTerms")
+        master_source = first_present(meta_master, TAG_XMP_DC_SOURCE, "XMP:Source")
+
+        prv_id = first_present(meta_prv, TAG_XMP_XMP_IDENTIFIER, TAG_XMP_DC_IDENTIFIER, "XMP:Identifier")
         assert prv_id
         assert prv_id != master_id
 
-        relation = meta_prv.get(TAG_XMP_DC_RELATION) or meta_prv.get("XMP:Relation")
+        relation = first_present(meta_prv, TAG_XMP_DC_RELATION, "XMP:Relation")
         assert relation == master_id
 
-        prv_desc = meta_prv.get(TAG_XMP_DC_DESCRIPTION) or meta_prv.get("XMP:Description")
-        prv_creator = meta_prv.get(TAG_XMP_DC_CREATOR) or meta_prv.get("XMP:Creator")
-        prv_rights = meta_prv.get(TAG_XMP_DC_RIGHTS) or meta_prv.get("XMP:Rights")
-        prv_credit = meta_prv.get(TAG_XMP_PHOTOSHOP_CREDIT) or meta_prv.get("XMP:Credit")
-        prv_usage = meta_prv.get(TAG_XMP_XMPRIGHTS_USAGE_TERMS) or meta_prv.get("XMP:UsageTerms")
-        prv_source = meta_prv.get(TAG_XMP_DC_SOURCE) or meta_prv.get("XMP:Source")
+        prv_desc = first_present(meta_prv, TAG_XMP_DC_DESCRIPTION, "XMP:Description")
+        prv_creator = first_present(meta_prv, TAG_XMP_DC_CREATOR, "XMP:Creator")
+        prv_rights = first_present(meta_prv, TAG_XMP_DC_RIGHTS, "XMP:Rights")
+        prv_credit = first_present(meta_prv, TAG_XMP_PHOTOSHOP_CREDIT, "XMP:Credit")
+        prv_usage = first_present(meta_prv, TAG_XMP_XMPRIGHTS_USAGE_TERMS, "XMP:UsageTerms")
+        prv_source = first_present(meta_prv, TAG_XMP_DC_SOURCE, "XMP:Source")
 
         assert prv_desc == master_desc
         assert prv_creator == master_creator
@@ -405,18 +356,17 @@ class TestMakerBatch:
         assert prv_usage == master_usage
         assert prv_source == master_source
 
-    def test_process_skips_metadata_when_no_metadata(self) -> None:
+    def test_process_skips_metadata_when_no_metadata(self, tmp_path: Path) -> None:
         """process_single_file does not call _write_derivative_metadata when no_metadata=True."""
-        temp_dir = self.create_temp_dir()
 
-        date_dir = temp_dir / "PHOTO_ARCHIVES" / "0001.Family" / "1950" / "1950.06.15"
+        date_dir = tmp_path / "PHOTO_ARCHIVES" / "0001.Family" / "1950" / "1950.06.15"
         sources_dir = date_dir / "SOURCES"
         sources_dir.mkdir(parents=True, exist_ok=True)
 
         msr_path = sources_dir / "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff"
         create_test_image(msr_path, format="TIFF")
 
-        archive_base = temp_dir / "PHOTO_ARCHIVES" / "0001.Family"
+        archive_base = tmp_path / "PHOTO_ARCHIVES" / "0001.Family"
         logger = Logger("test", console=False)
         maker = MakerTestDouble(
             logger,
@@ -428,18 +378,17 @@ class TestMakerBatch:
 
         mock_write.assert_not_called()
 
-    def test_process_writes_metadata_when_no_metadata_is_false(self) -> None:
+    def test_process_writes_metadata_when_no_metadata_is_false(self, tmp_path: Path) -> None:
         """process_single_file calls _write_derivative_metadata normally when flag is off."""
-        temp_dir = self.create_temp_dir()
 
-        date_dir = temp_dir / "PHOTO_ARCHIVES" / "0001.Family" / "1950" / "1950.06.15"
+        date_dir = tmp_path / "PHOTO_ARCHIVES" / "0001.Family" / "1950" / "1950.06.15"
         sources_dir = date_dir / "SOURCES"
         sources_dir.mkdir(parents=True, exist_ok=True)
 
         msr_path = sources_dir / "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff"
         create_test_image(msr_path, format="TIFF")
 
-        archive_base = temp_dir / "PHOTO_ARCHIVES" / "0001.Family"
+        archive_base = tmp_path / "PHOTO_ARCHIVES" / "0001.Family"
         logger = Logger("test", console=False)
         maker = MakerTestDouble(
             logger,
@@ -457,36 +406,14 @@ class TestMakerCustomFormats:
     Test Maker with custom path formats.
     """
 
-    def setup_method(self) -> None:
-        """
-        Setup for each test method.
-        """
-        self.temp_dir = None
-
-    def teardown_method(self) -> None:
-        """
-        Cleanup after each test method.
-        """
-        if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-
-    def create_temp_dir(self) -> Path:
-        """
-        Create a temporary directory.
-        """
-        temp_dir = tempfile.mkdtemp()
-        self.temp_dir = Path(temp_dir)
-        return self.temp_dir
-
-    def test_generate_prv_with_flat_path_structure(self) -> None:
+    def test_generate_prv_with_flat_path_structure(self, tmp_path: Path) -> None:
         """
         Test preview generation with flat path structure (no year folder).
         """
-        temp_dir = self.create_temp_dir()
         logger = Logger("test", console=False)
 
         # Create archive with flat structure: 2024.03.15/SOURCES/
-        date_dir = temp_dir / "archive" / "2024.03.15"
+        date_dir = tmp_path / "archive" / "2024.03.15"
         sources_dir = date_dir / "SOURCES"
         sources_dir.mkdir(parents=True, exist_ok=True)
 
@@ -509,24 +436,23 @@ class TestMakerCustomFormats:
         )
 
         # Generate preview
-        count = maker.execute(path=temp_dir / "archive", overwrite=False)
+        count = maker.execute(path=tmp_path / "archive", overwrite=False)
         assert count == 1
 
         # Preview should be in: 2024.03.15/2024.03.15.10.30.00.E.TEST.GRP.0001.A.PRV.jpg
         prv_name = "2024.03.15.10.30.00.E.TEST.GRP.0001.A.PRV.jpg"
-        prv_path = _expected_preview_path(temp_dir / "archive", msr_path, prv_name)
+        prv_path = _expected_preview_path(tmp_path / "archive", msr_path, prv_name)
 
         assert prv_path.exists(), f"PRV not found at {prv_path}"
 
-    def test_generate_prv_with_month_grouping(self) -> None:
+    def test_generate_prv_with_month_grouping(self, tmp_path: Path) -> None:
         """
         Test preview generation with year/month grouping.
         """
-        temp_dir = self.create_temp_dir()
         logger = Logger("test", console=False)
 
         # Create archive with month structure: 2024/2024.03/SOURCES/
-        date_dir = temp_dir / "archive" / "2024" / "2024.03"
+        date_dir = tmp_path / "archive" / "2024" / "2024.03"
         sources_dir = date_dir / "SOURCES"
         sources_dir.mkdir(parents=True, exist_ok=True)
 
@@ -547,24 +473,23 @@ class TestMakerCustomFormats:
             ),
         )
 
-        count = maker.execute(path=temp_dir / "archive", overwrite=False)
+        count = maker.execute(path=tmp_path / "archive", overwrite=False)
         assert count == 1
 
         # Preview should be in: 2024/2024.03/2024.03.15.10.30.00.E.TEST.GRP.0001.A.PRV.jpg
         prv_name = "2024.03.15.10.30.00.E.TEST.GRP.0001.A.PRV.jpg"
-        prv_path = _expected_preview_path(temp_dir / "archive", msr_path, prv_name)
+        prv_path = _expected_preview_path(tmp_path / "archive", msr_path, prv_name)
 
         assert prv_path.exists(), f"PRV not found at {prv_path}"
 
-    def test_generate_prv_with_group_in_path(self) -> None:
+    def test_generate_prv_with_group_in_path(self, tmp_path: Path) -> None:
         """
         Test preview generation with group in path structure.
         """
-        temp_dir = self.create_temp_dir()
         logger = Logger("test", console=False)
 
         # Create archive: FAM/2024/2024.03.15/SOURCES/
-        date_dir = temp_dir / "archive" / "FAM" / "2024" / "2024.03.15"
+        date_dir = tmp_path / "archive" / "FAM" / "2024" / "2024.03.15"
         sources_dir = date_dir / "SOURCES"
         sources_dir.mkdir(parents=True, exist_ok=True)
 
@@ -585,16 +510,16 @@ class TestMakerCustomFormats:
             ),
         )
 
-        count = maker.execute(path=temp_dir / "archive", overwrite=False)
+        count = maker.execute(path=tmp_path / "archive", overwrite=False)
         assert count == 1
 
         # Preview should be in: FAM/2024/2024.03.15/2024.03.15.10.30.00.E.FAM.POR.0001.A.PRV.jpg
         prv_name = "2024.03.15.10.30.00.E.FAM.POR.0001.A.PRV.jpg"
-        prv_path = _expected_preview_path(temp_dir / "archive", msr_path, prv_name)
+        prv_path = _expected_preview_path(tmp_path / "archive", msr_path, prv_name)
 
         assert prv_path.exists(), f"PRV not found at {prv_path}"
 
-    def test_generate_prv_with_compact_filename(self) -> None:
+    def test_generate_prv_with_compact_filename(self, tmp_path: Path) -> None:
         """
         Test preview generation with compact filename format.
 
@@ -602,11 +527,10 @@ class TestMakerCustomFormats:
         filename template and routing patterns must also be customised
         to match the alternative separator/field scheme.
         """
-        temp_dir = self.create_temp_dir()
         logger = Logger("test", console=False)
 
         # Create archive: 2024/2024.03.15/SOURCES/
-        date_dir = temp_dir / "archive" / "2024" / "2024.03.15"
+        date_dir = tmp_path / "archive" / "2024" / "2024.03.15"
         sources_dir = date_dir / "SOURCES"
         sources_dir.mkdir(parents=True, exist_ok=True)
 
@@ -639,11 +563,11 @@ class TestMakerCustomFormats:
             ),
         )
 
-        count = maker.execute(path=temp_dir / "archive", overwrite=False)
+        count = maker.execute(path=tmp_path / "archive", overwrite=False)
         assert count == 1
 
         # Preview should have compact name: 20240315_103000_TEST_PRV.jpg
         prv_name = "20240315_103000_TEST_PRV.jpg"
-        prv_path = _expected_preview_path(temp_dir / "archive", msr_path, prv_name)
+        prv_path = _expected_preview_path(tmp_path / "archive", msr_path, prv_name)
 
         assert prv_path.exists(), f"PRV not found at {prv_path}"
@@ -11,8 +11,10 @@ where test doubles inherit real classes and only override what is needed.
 
 import datetime
 from pathlib import Path
+from typing import Any
 
 from common.logger import Logger
+from common.tagger import Tagger
 from scan_batcher.workflow import MetadataWorkflow
 
 
@@ -63,6 +65,32 @@ class FakeMetadataWorkflow(MetadataWorkflow):
         """
         self._write_xmp_history(file_path, file_datetime)
 
+    def build_xmp_tags(
+        self,
+        file_path: Path,
+        file_datetime: datetime.datetime,
+        existing_tags: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Build XMP metadata tags without touching disk (public wrapper for _build_xmp_history).
+
+        Returns the same tags that :meth:`write_xmp_metadata` would write,
+        merged into a single ``{tag: value}`` dict suitable for
+        ``Exifer.write``. Lets fixtures combine them with other tags
+        and write everything in one exiftool call.
+
+        Args:
+            file_path: Path to the target file (used for dc:Format).
+            file_datetime: Datetime for metadata (with timezone).
+            existing_tags: Tags already present in (or about to be written
+                to) the file, keyed by exiftool tag name.
+
+        Returns:
+            Tag names mapped to values.
+        """
+        tags = self._build_xmp_history(file_path, file_datetime, existing_tags)
+        return Tagger._collect_write_args(tags)
+
     def get_digitized_datetime(self, file_path: Path) -> datetime.datetime:
         """
         Extract digitized datetime from file (public wrapper for _get_digitized_datetime).
@@ -3,8 +3,6 @@ Tests for MetadataWorkflow (scan_batcher).
 """
 
 import datetime
-import shutil
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -18,23 +16,10 @@ import pytest
 class TestMetadataWorkflow:
     """Tests for MetadataWorkflow including --no-metadata flag."""
 
-    def setup_method(self):
-        self.temp_dir = None
-
-    def teardown_method(self):
-        if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-
-    def create_temp_dir(self) -> Path:
-        temp_dir = tempfile.mkdtemp()
-        self.temp_dir = Path(temp_dir)
-        return self.temp_dir
-
     @pytest.mark.skipif(not exiftool_available(), reason="exiftool not installed")
-    def test_write_xmp_history_skipped_when_no_metadata(self):
+    def test_write_xmp_history_skipped_when_no_metadata(self, tmp_path: Path):
         """_write_xmp_history skips exiftool when no_metadata=True."""
-        temp_dir = self.create_temp_dir()
-        file_path = temp_dir / "test.tiff"
+        file_path = tmp_path / "test.tiff"
         create_test_image(file_path, add_ids=False)
 
         logger = Logger("test", console=False)
@@ -48,10 +33,9 @@ class TestMetadataWorkflow:
         mock_exifer.write.assert_not_called()
 
     @pytest.mark.skipif(not exiftool_available(), reason="exiftool not installed")
-    def test_write_xmp_history_works_when_no_metadata_is_false(self):
+    def test_write_xmp_history_works_when_no_metadata_is_false(self, tmp_path: Path):
         """_write_xmp_history writes metadata normally when flag is off."""
-        temp_dir = self.create_temp_dir()
-        file_path = temp_dir / "test.tiff"
+        file_path = tmp_path / "test.tiff"
         create_test_image(file_path, add_ids=False)
 
         logger = Logger("test", console=False)
@@ -1,8 +1,5 @@
 """Regression tests for Cutter batch behavior."""
 
-import os
-import shutil
-import tempfile
 from pathlib import Path
 
 from PIL import Image
@@ -35,22 +32,6 @@ class CutterTestDouble(Cutter):
 
 class TestCutterBatch:
 
-    def setup_method(self) -> None:
-        self.temp_dir: Path | None = None
-
-    def teardown_method(self) -> None:
-        if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir, onerror=self._force_remove)
-
-    @staticmethod
-    def _force_remove(func: object, path: str, exc_info: object) -> None:
-        os.chmod(path, 0o700)
-        os.unlink(path)
-
-    def create_temp_dir(self) -> Path:
-        self.temp_dir = Path(tempfile.mkdtemp())
-        return self.temp_dir
-
     def _make_archive(self, temp_dir: Path, filename: str, size: tuple[int, int] = (800, 600)) -> tuple[Path, Path]:
         """Create a minimal archive fragment with one source file.
 
@@ -92,11 +73,10 @@ class TestCutterBatch:
         )
         return len([d for d in tile_dir.iterdir() if d.is_dir()])
 
-    def test_batch_generates_tile_pyramid(self) -> None:
+    def test_batch_generates_tile_pyramid(self, tmp_path: Path) -> None:
         """Batch execute produces a tile set with the expected zoom structure."""
-        temp_dir = self.create_temp_dir()
         archive, src = self._make_archive(
-            temp_dir, "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff", size=(800, 600)
+            tmp_path, "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff", size=(800, 600)
         )
 
         cutter = Cutter(Logger("test_tile_cutter"))
@@ -112,11 +92,10 @@ class TestCutterBatch:
         tiles = list(z0.rglob("*.png"))
         assert len(tiles) >= 1
 
-    def test_tiles_are_valid_pngs(self) -> None:
+    def test_tiles_are_valid_pngs(self, tmp_path: Path) -> None:
         """Every tile file must be a readable PNG with alpha channel."""
-        temp_dir = self.create_temp_dir()
         archive, _ = self._make_archive(
-            temp_dir, "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff", size=(512, 512)
+            tmp_path, "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff", size=(512, 512)
         )
 
         cutter = Cutter(Logger("test_tile_cutter"))
@@ -127,11 +106,10 @@ class TestCutterBatch:
                 assert img.format == "PNG"
                 assert img.mode == "RGBA"
 
-    def test_tiles_never_exceed_tile_size(self) -> None:
+    def test_tiles_never_exceed_tile_size(self, tmp_path: Path) -> None:
         """No tile dimension exceeds the configured tile_size (default 256)."""
-        temp_dir = self.create_temp_dir()
         archive, _ = self._make_archive(
-            temp_dir, "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff", size=(1024, 768)
+            tmp_path, "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff", size=(1024, 768)
         )
 
         cutter = Cutter(Logger("test_tile_cutter"))
@@ -141,11 +119,10 @@ class TestCutterBatch:
             with Image.open(tile_path) as img:
                 assert max(img.size) <= 256
 
-    def test_skips_existing_tile_set_without_overwrite(self) -> None:
+    def test_skips_existing_tile_set_without_overwrite(self, tmp_path: Path) -> None:
         """Second call without overwrite returns 0 (already generated)."""
-        temp_dir = self.create_temp_dir()
         archive, _ = self._make_archive(
-            temp_dir, "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff"
+            tmp_path, "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff"
         )
 
         cutter = Cutter(Logger("test_tile_cutter"))
@@ -155,11 +132,10 @@ class TestCutterBatch:
         second = cutter.execute(path=archive, overwrite=False)
         assert second == 0
 
-    def test_overwrite_regenerates_tile_set(self) -> None:
+    def test_overwrite_regenerates_tile_set(self, tmp_path: Path) -> None:
         """overwrite=True regenerates the tile set."""
-        temp_dir = self.create_temp_dir()
         archive, _ = self._make_archive(
-            temp_dir, "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff"
+            tmp_path, "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff"
         )
 
         cutter = Cutter(Logger("test_tile_cutter"))
@@ -167,10 +143,9 @@ class TestCutterBatch:
         count = cutter.execute(path=archive, overwrite=True)
         assert count == 1
 
-    def test_prefers_msr_over_raw(self) -> None:
+    def test_prefers_msr_over_raw(self, tmp_path: Path) -> None:
         """When both MSR and RAW exist for the same shot, only MSR is processed."""
-        temp_dir = self.create_temp_dir()
-        sources = temp_dir / "archive" / "1950" / "1950.06.15" / "SOURCES"
+        sources = tmp_path / "archive" / "1950" / "1950.06.15" / "SOURCES"
         sources.mkdir(parents=True, exist_ok=True)
 
         msr = sources / "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff"
@@ -178,7 +153,7 @@ class TestCutterBatch:
         create_test_image(msr, size=(400, 300), format="TIFF")
         create_test_image(raw, size=(400, 300), format="TIFF")
 
-        archive = temp_dir / "archive"
+        archive = tmp_path / "archive"
         cutter = Cutter(Logger("test_tile_cutter"))
         count = cutter.execute(path=archive, overwrite=False)
 
@@ -189,12 +164,11 @@ class TestCutterBatch:
         assert msr_tiles.exists()
         assert not raw_tiles.exists()
 
-    def test_zoom_levels_increase_with_image_size(self) -> None:
+    def test_zoom_levels_increase_with_image_size(self, tmp_path: Path) -> None:
         """A larger image produces more zoom levels than a smaller one."""
-        temp_dir = self.create_temp_dir()
 
-        small_dir = temp_dir / "small"
-        large_dir = temp_dir / "large"
+        small_dir = tmp_path / "small"
+        large_dir = tmp_path / "large"
 
         small_archive = self._make_archive_at(small_dir, (256, 256))
         large_archive = self._make_archive_at(large_dir, (2048, 2048))
@@ -208,11 +182,10 @@ class TestCutterBatch:
         large_levels = self._zoom_levels(large_archive, stem)
         assert large_levels > small_levels
 
-    def test_staging_dir_cleaned_up_on_success(self) -> None:
+    def test_staging_dir_cleaned_up_on_success(self, tmp_path: Path) -> None:
         """The .tmp staging directory must not remain after successful generation."""
-        temp_dir = self.create_temp_dir()
         archive, src = self._make_archive(
-            temp_dir, "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff"
+            tmp_path, "1950.06.15.12.00.00.E.FAM.POR.0001.A.MSR.tiff"
         )
 
         cutter = Cutter(Logger("test_tile_cutter"))
@@ -225,26 +198,16 @@ class TestCutterBatch:
 
 class TestCutterSingleFile:
 
-    def setup_method(self) -> None:
-        self.temp_dir: Path | None = None
-
     def teardown_method(self) -> None:
         ProjectConfig.instance(data=DEFAULT_CONFIG)
-        if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-
-    def create_temp_dir(self) -> Path:
-        self.temp_dir = Path(tempfile.mkdtemp())
-        return self.temp_dir
 
-    def test_process_single_file_returns_true(self) -> None:
-        temp_dir = self.create_temp_dir()
-        sources = temp_dir / "archive" / "1952" / "1952.03.10" / "SOURCES"
+    def test_process_single_file_returns_true(self, tmp_path: Path) -> None:
+        sources = tmp_path / "archive" / "1952" / "1952.03.10" / "SOURCES"
         sources.mkdir(parents=True, exist_ok=True)
         src = sources / "1952.03.10.08.00.00.E.FAM.POR.0001.A.MSR.tiff"
         create_test_image(src, size=(512, 384), format="TIFF")
 
-        archive = temp_dir / "archive"
+        archive = tmp_path / "archive"
         cutter = CutterTestDouble(Logger("test"))
         result = cutter.process_single_file_for_test(
             src,
@@ -253,14 +216,13 @@ class TestCutterSingleFile:
         )
         assert result is True
 
-    def test_process_single_file_skips_on_second_call(self) -> None:
-        temp_dir = self.create_temp_dir()
-        sources = temp_dir / "archive" / "1952" / "1952.03.10" / "SOURCES"
+    def test_process_single_file_skips_on_second_call(self, tmp_path: Path) -> None:
+        sources = tmp_path / "archive" / "1952" / "1952.03.10" / "SOURCES"
         sources.mkdir(parents=True, exist_ok=True)
         src = sources / "1952.03.10.08.00.00.E.FAM.POR.0001.A.MSR.tiff"
         create_test_image(src, size=(512, 384), format="TIFF")
 
-        archive = temp_dir / "archive"
+        archive = tmp_path / "archive"
         cutter = CutterTestDouble(Logger("test"))
         cutter.process_single_file_for_test(src, archive_path=archive, overwrite=False)
         result = cutter.process_single_file_for_test(
@@ -270,15 +232,14 @@ class TestCutterSingleFile:
         )
         assert result is False
 
-    def test_tile_dir_path_matches_date_from_filename(self) -> None:
+    def test_tile_dir_path_matches_date_from_filename(self, tmp_path: Path) -> None:
         """Tile directory must reflect year/month/day from the filename."""
-        temp_dir = self.create_temp_dir()
-        sources = temp_dir / "archive" / "1963" / "1963.11.22" / "SOURCES"
+        sources = tmp_path / "archive" / "1963" / "1963.11.22" / "SOURCES"
         sources.mkdir(parents=True, exist_ok=True)
         src = sources / "1963.11.22.14.30.00.E.FAM.POR.0002.A.MSR.tiff"
         create_test_image(src, size=(400, 300), format="TIFF")
 
-        archive = temp_dir / "archive"
+        archive = tmp_path / "archive"
         cutter = CutterTestDouble(Logger("test"))
         cutter.process_single_file_for_test(src, archive_path=archive, overwrite=False)
 